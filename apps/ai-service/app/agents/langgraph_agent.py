@@ -436,7 +436,7 @@ Incorporate this data naturally into your response. If the data answers the ques
         Returns:
             Response dict with 'content', 'tools_used', and metadata
         """
-        session_id = session_id or str(uuid.uuid4())
+        session_id = session_id or uuid.uuid4().hex
         
         # Convert to LangChain messages
         lc_messages = []
@@ -123,7 +123,7 @@ class LegalAssistantAgent:
         Returns:
             Response dict with 'content', 'usage', and metadata
         """
-        session_id = session_id or str(uuid.uuid4())
+        session_id = session_id or uuid.uuid4().hex
         
         # Convert to LangChain messages
         lc_messages = [
@@ -176,7 +176,7 @@ class LegalAssistantAgent:
         Yields:
             Dict with 'content' for each token chunk
         """
-        session_id = session_id or str(uuid.uuid4())
+        session_id = session_id or uuid.uuid4().hex
         
         # Convert to LangChain messages
         lc_messages = []
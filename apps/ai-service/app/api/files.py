@@ -120,7 +120,7 @@ async def upload_file(
         )
     
     # Generate file ID
-    file_id = str(uuid.uuid4())
+    file_id = uuid.uuid4().hex
     
     # Read file content
     content = await file.read()
@@ -5,11 +5,14 @@ Now with LangGraph agentic capabilities for tool calling.
 """
 
 from typing import Optional, List, AsyncGenerator
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from functools import lru_cache
 from pydantic import BaseModel, Field
 from enum import Enum
+import asyncio
 import json
+import orjson
 import time
 import uuid
 import structlog
@@ -21,7 +24,7 @@ from app.models.ollama_client import get_ollama_client, get_ollama_model_name
 from app.models.groq_client import get_groq_client, GROQ_MODELS
 from app.routing import TrustRouter, AuditLogger, RoutingDecision, ModelProvider
 from app.config import settings
-from app.db import get_db, get_optional_db
+from app.db import get_db, get_optional_db, get_session, run_with_retry
 from app.services import session_store
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -52,6 +55,62 @@ groq_client = get_groq_client()
 # LangGraph agent instance (initialized lazily)
 _langgraph_agent: Optional[LangGraphLegalAgent] = None
 
+# Keep strong references to fire-and-forget tasks so they aren't GC'd mid-flight
+_background_tasks: set = set()
+
+
+def _log_audit_background(**kwargs) -> None:
+    """Fire audit logging as a background task so inference starts immediately."""
+    task = asyncio.create_task(audit_logger.log_async(**kwargs))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _persist_messages(
+    session_id: str,
+    user_message,
+    assistant_content: str,
+    meta: dict,
+) -> None:
+    """
+    Persist the last user + assistant messages for resume.
+
+    Runs as a background task so the HTTP response doesn't wait on the
+    DB round-trips. Uses its own short-lived session rather than the
+    request-scoped one, which may already be closed by the time we run.
+    """
+    try:
+        batch = []
+        if user_message is not None:
+            batch.append((user_message.role.value, user_message.content, None))
+        batch.append((_ASSISTANT_ROLE_STR, assistant_content, meta))
+
+        async def _write(session):
+            # One explicit BEGIN/COMMIT pair (and one WAL sync) for the batch;
+            # append_messages only flushes, it never commits
+            async with session.begin():
+                await session_store.append_messages(
+                    session,
+                    session_id=session_id,
+                    messages=batch,
+                )
+
+        await run_with_retry(_write)
+    except Exception as persist_error:
+        logger.warning("message_persistence_failed", error=str(persist_error))
+
+
+async def _ensure_session(session_id, user_id) -> str:
+    """
+    Upsert the chat session on a dedicated short-lived session and commit,
+    so the row exists for the background message writer. Runs as a task
+    overlapping with inference.
+    """
+    async with get_session() as session:
+        sid = await session_store.ensure_session(session, session_id, user_id)
+        await session.commit()
+        return sid
+
 
 def get_langgraph_agent(llm) -> LangGraphLegalAgent:
     """Get or create the LangGraph agent."""
@@ -62,34 +121,77 @@ def get_langgraph_agent(llm) -> LangGraphLegalAgent:
     return _langgraph_agent
 
 
-def detect_needs_tools(query: str) -> bool:
-    """Quick detection of whether a query needs external tools."""
+# Cloud fallback agent (initialized lazily, shared across requests)
+_cloud_agent: Optional[LegalAssistantAgent] = None
+
+
+def _get_cloud_agent() -> LegalAssistantAgent:
+    """Get or create the shared cloud-fallback agent."""
+    global _cloud_agent
+    if _cloud_agent is None:
+        llm = LLMRouter().get_model(ModelType(settings.DEFAULT_MODEL))
+        _cloud_agent = LegalAssistantAgent(llm=llm)
+        logger.info("cloud_agent_initialized", model=settings.DEFAULT_MODEL)
+    return _cloud_agent
+
+
+async def _run_groq(
+    request: "TrustChatRequest",
+    messages: List[dict],
+    model: str = "llama-3.1-8b-instant",
+) -> str:
+    """Run a chat completion on the shared Groq client and return the content."""
+    groq_response = await groq_client.chat_completion(
+        messages=messages,
+        model=model,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens or 4096,
+    )
+    return groq_response.get("content", "")
+
+
+async def _run_cloud_fallback(request: "TrustChatRequest", messages: List[dict]) -> str:
+    """Run inference on the shared cloud agent and return the response content."""
+    cloud_response = await _get_cloud_agent().process(
+        messages=messages,
+        session_id=request.session_id,
+    )
+    return cloud_response.get("content", "")
+
+
+def detect_needs_tools(query: str) -> Optional[str]:
+    """
+    Quick detection of whether a query needs external tools.
+
+    Returns the matched tool category ("weather", "datetime", "search",
+    "calc") or None, so the dispatcher doesn't re-scan the query.
+    """
     query_lower = query.lower()
-    
+
     # Weather patterns
     weather_keywords = ["weather", "temperature", "rain", "sunny", "forecast", "climate", "hot ", "cold "]
     if any(kw in query_lower for kw in weather_keywords):
         location_patterns = ["in ", "at ", "for ", "of ", "today", "now", "current"]
         if any(p in query_lower for p in location_patterns):
-            return True
-    
+            return "weather"
+
     # Time/date patterns
     time_keywords = ["what time", "current time", "what date", "today's date", "what day is"]
     if any(kw in query_lower for kw in time_keywords):
-        return True
-    
+        return "datetime"
+
     # Current events/search patterns
-    search_keywords = ["latest news", "recent news", "current news", "happening now", "breaking news", 
+    search_keywords = ["latest news", "recent news", "current news", "happening now", "breaking news",
                        "latest update", "what's happening"]
     if any(kw in query_lower for kw in search_keywords):
-        return True
-    
+        return "search"
+
     # Calculation patterns
     calc_keywords = ["calculate", "compute", "gst", "% of", "percent"]
     if any(kw in query_lower for kw in calc_keywords):
-        return True
-    
-    return False
+        return "calc"
+
+    return None
 
 
 def extract_location_from_query(query: str) -> str:
@@ -149,6 +251,13 @@ class Message(BaseModel):
     content: str
 
 
+# Evaluated once - enum .value goes through a descriptor lookup each time
+_ASSISTANT_ROLE_STR = MessageRole.ASSISTANT.value
+
+# USD to INR conversion used in all cost displays
+_USD_TO_INR = 83
+
+
 class TrustInfo(BaseModel):
     """Trust transparency information for UI"""
     is_local: bool
@@ -223,7 +332,7 @@ IMPORTANT: The user has attached a document. When answering questions:
     return base_prompt
 
 
-@router.post("/trust/completions", response_model=TrustChatResponse)
+@router.post("/trust/completions", response_model=TrustChatResponse, response_class=ORJSONResponse)
 async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[AsyncSession] = Depends(get_optional_db)):
     """
     Create a privacy-first chat completion with full transparency.
@@ -237,24 +346,30 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
     try:
         start_time = time.time()
         
-        # DEBUG: Log incoming request
-        print(f"[TRUST_CHAT] Received request with {len(request.messages)} messages")
-        print(f"[TRUST_CHAT] file_attached={request.file_attached}")
-        for i, m in enumerate(request.messages):
-            print(f"[TRUST_CHAT] Message {i}: role={m.role.value}, content_len={len(m.content)}")
-            # Log first 500 chars of content to see if document is included
-            if m.role == MessageRole.USER:
-                preview = m.content[:500] if len(m.content) > 500 else m.content
-                print(f"[TRUST_CHAT] User message preview: {preview}")
-        
+        # Request details only when debugging - formatting per-message
+        # previews on every call is wasted work in production
+        if settings.DEBUG:
+            logger.debug(
+                "trust_chat_request",
+                message_count=len(request.messages),
+                file_attached=request.file_attached,
+                roles=[m.role.value for m in request.messages],
+            )
+
         # Get user's message content for routing analysis
         user_content = " ".join([
-            m.content for m in request.messages 
+            m.content for m in request.messages
             if m.role == MessageRole.USER
         ])
-        
+
+        # Convert the Pydantic message list to plain dicts exactly once;
+        # every downstream branch reuses this reference
+        converted = [
+            {"role": m.role.value, "content": m.content} for m in request.messages
+        ]
+
         # Step 0: Check if this query needs external tools (LangGraph agent)
-        needs_tools = detect_needs_tools(user_content)
+        tool_category = detect_needs_tools(user_content)
         tools_used = []
         
         # Step 1: Trust-aware routing decision
@@ -268,32 +383,49 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
             estimated_tokens=len(user_content.split()) * 2  # Rough estimate
         )
         
-        # Step 2: Log the routing decision (for compliance)
-        audit_logger.log(
+        # Step 2: Log the routing decision (for compliance) in the background
+        _log_audit_background(
             routing_result=routing_result,
             content=user_content,
             session_id=request.session_id,
             user_id=request.user_id
         )
         
+        # Kick off the session upsert now so its DB round-trip overlaps with
+        # inference; the result is awaited when the response is assembled
+        session_task = (
+            asyncio.create_task(_ensure_session(request.session_id, request.user_id))
+            if db is not None else None
+        )
+
         # Step 3: Execute inference based on routing decision
         model_id = routing_result.selected_model.model_id
         response_content = ""
+
+        # Build the provider message list once; every Ollama/Groq branch
+        # reuses it instead of re-converting and re-scanning per branch
+        has_system = any(m.role == MessageRole.SYSTEM for m in request.messages)
+        provider_messages = (
+            converted if has_system
+            else [
+                {"role": "system", "content": get_legal_system_prompt(request.file_attached)},
+                *converted,
+            ]
+        )
         
         # ======================================================================
         # FAST PATH: Direct tool execution for simple patterns
         # ======================================================================
-        if needs_tools:
-            logger.info("fast_tool_path", reason="Direct tool execution for speed")
-            
+        if tool_category:
+            logger.info("fast_tool_path", category=tool_category, reason="Direct tool execution for speed")
+
             try:
                 from app.tools.external_apis import get_weather, get_current_datetime, calculate
-                
+
                 user_query = request.messages[-1].content if request.messages else ""
-                query_lower = user_query.lower()
-                
+
                 # Weather query - call tool directly
-                if any(kw in query_lower for kw in ["weather", "temperature"]):
+                if tool_category == "weather":
                     location = extract_location_from_query(user_query)
                     logger.info("calling_weather_tool", location=location)
                     
@@ -307,7 +439,7 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
 *Data retrieved using: get_weather*"""
                 
                 # DateTime query
-                elif any(kw in query_lower for kw in ["what time", "current time", "what date", "today's date"]):
+                elif tool_category == "datetime":
                     tool_result = get_current_datetime.invoke({"timezone": "Asia/Kolkata"})
                     tools_used = ["get_current_datetime"]
                     response_content = f"""{tool_result}
@@ -316,7 +448,7 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
 *Data retrieved using: get_current_datetime*"""
                 
                 # Calculation query
-                elif any(kw in query_lower for kw in ["calculate", "compute", "gst"]):
+                elif tool_category == "calc":
                     expression = extract_expression_from_query(user_query)
                     if expression:
                         tool_result = calculate.invoke({"expression": expression})
@@ -331,21 +463,19 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
             except Exception as e:
                 logger.error("fast_tool_failed", error=str(e))
                 # Fall back to standard inference
-                needs_tools = False
+                tool_category = None
                 tools_used = []
-        
+
         # If tools path ran but produced no content, fall back to standard inference
-        if needs_tools and not response_content:
+        if tool_category and not response_content:
             logger.info("tools_path_no_content_fallback_to_standard")
-            print("[TRUST_CHAT] Tools path produced no content, falling back to standard inference")
-            needs_tools = False  # Reset to allow standard path
-        
+            tool_category = None  # Reset to allow standard path
+
         # ======================================================================
         # STANDARD PATH: Direct LLM inference (no tools or tool failed)
         # ======================================================================
-        if not needs_tools and not response_content:
+        if not tool_category and not response_content:
             logger.info("standard_inference_path", is_local=routing_result.is_local, model_id=model_id)
-            print(f"[TRUST_CHAT] Standard inference path - is_local: {routing_result.is_local}, model_id: {model_id}")
             
             # Check if this is an open-source model (Groq)
             selected_provider = routing_result.selected_model.provider
@@ -361,28 +491,16 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     provider="groq",
                     reason="Open-source model selected"
                 )
-                print(f"[TRUST_CHAT] Using OPENSOURCE model via Groq: {model_id}")
                 
                 try:
                     if not groq_client.is_available:
                         raise ValueError("Groq API key not configured")
                     
-                    # Prepare messages for Groq
-                    groq_messages = [
-                        {"role": m.role.value, "content": m.content}
-                        for m in request.messages
-                    ]
-                    
-                    # Add system prompt for legal context
-                    if not any(m["role"] == "system" for m in groq_messages):
-                        groq_messages.insert(0, {
-                            "role": "system",
-                            "content": get_legal_system_prompt(request.file_attached)
-                        })
-                    
+                    # Messages (with system prompt) were prepared once above
+                    groq_messages = provider_messages
+
                     # Call Groq with the selected model
                     logger.info("calling_groq", model=model_id, num_messages=len(groq_messages))
-                    print(f"[TRUST_CHAT] Calling Groq with model: {model_id}, messages: {len(groq_messages)}")
                     
                     groq_response = await groq_client.chat_completion(
                         messages=groq_messages,
@@ -392,7 +510,6 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     )
                     
                     response_content = groq_response.get("content", "")
-                    print(f"[TRUST_CHAT] Groq response received - content_length: {len(response_content)}")
                     logger.info(
                         "opensource_inference_complete",
                         model=model_id,
@@ -402,22 +519,12 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     
                 except Exception as e:
                     logger.error("groq_inference_failed", error=str(e))
-                    print(f"[TRUST_CHAT] Groq failed: {e}")
                     
                     # Fallback to cloud for non-sensitive content
                     if not request.force_local and not routing_result.privacy_scan.force_local:
                         logger.warning("groq_failed_fallback_to_cloud", error=str(e))
                         try:
-                            llm_router = LLMRouter()
-                            model_type = ModelType(settings.DEFAULT_MODEL)
-                            llm = llm_router.get_model(model_type)
-                            agent_fallback = LegalAssistantAgent(llm=llm)
-                            
-                            cloud_response = await agent_fallback.process(
-                                messages=[{"role": m.role.value, "content": m.content} for m in request.messages],
-                                session_id=request.session_id,
-                            )
-                            response_content = cloud_response.get("content", "")
+                            response_content = await _run_cloud_fallback(request, converted)
                             routing_result.is_local = False
                             routing_result.trust_message = "⚠️ Open-source unavailable - using cloud fallback"
                         except Exception as cloud_error:
@@ -442,33 +549,20 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     is_local=True,
                     reason=routing_result.trust_message
                 )
-                print(f"[TRUST_CHAT] Using LOCAL model: {model_id}")
                 
                 try:
                     # Check Ollama health
                     ollama_healthy = await ollama_client.health_check()
-                    print(f"[TRUST_CHAT] Ollama health check: {ollama_healthy}")
                     
                     if ollama_healthy:
                         # Convert model ID to Ollama format
                         ollama_model = get_ollama_model_name(model_id)
                         
-                        # Prepare messages for Ollama
-                        ollama_messages = [
-                            {"role": m.role.value, "content": m.content}
-                            for m in request.messages
-                        ]
-                        
-                        # Add system prompt for legal context
-                        if not any(m["role"] == "system" for m in ollama_messages):
-                            ollama_messages.insert(0, {
-                                "role": "system",
-                                "content": get_legal_system_prompt(request.file_attached)
-                            })
-                        
+                        # Messages (with system prompt) were prepared once above
+                        ollama_messages = provider_messages
+
                         # Call Ollama
                         logger.info("calling_ollama", model=ollama_model, num_messages=len(ollama_messages))
-                        print(f"[TRUST_CHAT] Calling Ollama with model: {ollama_model}, messages: {len(ollama_messages)}")
                         
                         ollama_response = await ollama_client.chat(
                             model=ollama_model,
@@ -478,8 +572,6 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                         )
                         
                         response_content = ollama_response.content
-                        print(f"[TRUST_CHAT] Ollama response received - content_length: {len(response_content)}")
-                        print(f"[TRUST_CHAT] Ollama response preview: {response_content[:200] if response_content else 'EMPTY'}")
                         logger.info(
                             "local_inference_complete",
                             model=ollama_model,
@@ -490,31 +582,11 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     else:
                         # Ollama not available, try Groq as open-source fallback
                         logger.warning("ollama_unavailable_trying_groq")
-                        print("[TRUST_CHAT] Ollama unavailable, trying Groq fallback...")
                         
                         if groq_client.is_available:
-                            # Use Groq with open-source model
-                            groq_messages = [
-                                {"role": m.role.value, "content": m.content}
-                                for m in request.messages
-                            ]
-                            if not any(m["role"] == "system" for m in groq_messages):
-                                groq_messages.insert(0, {
-                                    "role": "system",
-                                    "content": get_legal_system_prompt(request.file_attached)
-                                })
-                            
-                            # Use llama-3.1-8b-instant as fast fallback
-                            groq_model = "llama-3.1-8b-instant"
-                            groq_response = await groq_client.chat_completion(
-                                messages=groq_messages,
-                                model=groq_model,
-                                temperature=request.temperature,
-                                max_tokens=request.max_tokens or 4096
-                            )
-                            response_content = groq_response.get("content", "")
+                            # Use Groq with llama-3.1-8b-instant as fast fallback
+                            response_content = await _run_groq(request, provider_messages)
                             routing_result.trust_message = "🔵 Using open-source model (Groq) - Ollama unavailable"
-                            print(f"[TRUST_CHAT] Groq fallback successful - content_length: {len(response_content)}")
                         else:
                             # No local options, check if cloud fallback is allowed
                             if request.force_local or routing_result.privacy_scan.force_local:
@@ -525,16 +597,7 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                             
                             # Use cloud as last resort
                             logger.warning("no_local_options_fallback_to_cloud")
-                            llm_router = LLMRouter()
-                            model_type = ModelType(settings.DEFAULT_MODEL)
-                            llm = llm_router.get_model(model_type)
-                            agent_fallback = LegalAssistantAgent(llm=llm)
-                            
-                            cloud_response = await agent_fallback.process(
-                                messages=[{"role": m.role.value, "content": m.content} for m in request.messages],
-                                session_id=request.session_id,
-                            )
-                            response_content = cloud_response.get("content", "")
+                            response_content = await _run_cloud_fallback(request, converted)
                             routing_result.is_local = False
                             routing_result.trust_message = "⚠️ Local unavailable - using cloud fallback (no sensitive data detected)"
                         
@@ -542,29 +605,12 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     raise
                 except Exception as e:
                     logger.error("local_inference_failed", error=str(e))
-                    print(f"[TRUST_CHAT] Local inference failed: {e}")
                     
                     # Try Groq as fallback before cloud
                     if groq_client.is_available:
                         logger.warning("ollama_failed_trying_groq", error=str(e))
                         try:
-                            groq_messages = [
-                                {"role": m.role.value, "content": m.content}
-                                for m in request.messages
-                            ]
-                            if not any(m["role"] == "system" for m in groq_messages):
-                                groq_messages.insert(0, {
-                                    "role": "system",
-                                    "content": get_legal_system_prompt(request.file_attached)
-                                })
-                            
-                            groq_response = await groq_client.chat_completion(
-                                messages=groq_messages,
-                                model="llama-3.1-8b-instant",
-                                temperature=request.temperature,
-                                max_tokens=request.max_tokens or 4096
-                            )
-                            response_content = groq_response.get("content", "")
+                            response_content = await _run_groq(request, provider_messages)
                             routing_result.trust_message = "🔵 Using open-source model (Groq) - local inference failed"
                         except Exception as groq_error:
                             logger.error("groq_fallback_failed", error=str(groq_error))
@@ -574,16 +620,7 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     if not response_content and not request.force_local and not routing_result.privacy_scan.force_local:
                         logger.warning("all_local_failed_fallback_to_cloud", error=str(e))
                         try:
-                            llm_router = LLMRouter()
-                            model_type = ModelType(settings.DEFAULT_MODEL)
-                            llm = llm_router.get_model(model_type)
-                            agent_fallback = LegalAssistantAgent(llm=llm)
-                            
-                            cloud_response = await agent_fallback.process(
-                                messages=[{"role": m.role.value, "content": m.content} for m in request.messages],
-                                session_id=request.session_id,
-                            )
-                            response_content = cloud_response.get("content", "")
+                            response_content = await _run_cloud_fallback(request, converted)
                             # Update routing info to reflect cloud fallback
                             routing_result.is_local = False
                             routing_result.trust_message = "⚠️ Local unavailable - using cloud fallback (no sensitive data detected)"
@@ -607,59 +644,54 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
                     reason="Non-sensitive content"
                 )
                 
-                llm_router = LLMRouter()
-                model_type = ModelType(settings.DEFAULT_MODEL)
-                llm = llm_router.get_model(model_type)
-                agent_cloud = LegalAssistantAgent(llm=llm)
-                
-                cloud_response = await agent_cloud.process(
-                    messages=[{"role": m.role.value, "content": m.content} for m in request.messages],
-                    session_id=request.session_id,
-                )
-                response_content = cloud_response.get("content", "")
+                response_content = await _run_cloud_fallback(request, converted)
         
         latency_ms = int((time.time() - start_time) * 1000)
         
         # Step 5: Build response with trust information
-        trust_details = routing_result.trust_details.copy()
-        
         # Update badge and details based on actual tool usage
         actual_badge = routing_result.trust_badge
         actual_message = routing_result.trust_message
-        
+
         if tools_used:
             # External tools were used (weather, search, etc.) - different from cloud LLM
             tool_names = ', '.join(tools_used)
-            trust_details.append(f"🔧 External data: {tool_names}")
-            trust_details.append("ℹ️ Only query sent to tool API (not documents/PII)")
-            
+            trust_details = [
+                *routing_result.trust_details,
+                f"🔧 External data: {tool_names}",
+                "ℹ️ Only query sent to tool API (not documents/PII)",
+            ]
+
             # Badge should show tool usage
             if routing_result.is_local:
                 actual_badge = "🏠 LOCAL + 🔧 TOOLS"
                 actual_message = f"Local LLM with external data tools ({tool_names})"
+        else:
+            # No tool annotations to add - reuse the routing result's list
+            trust_details = routing_result.trust_details
         
         trust_info = TrustInfo(
             is_local=routing_result.is_local,
             trust_badge=actual_badge,
             trust_message=actual_message,
             trust_details=trust_details,
-            sensitivity_level=routing_result.privacy_scan.sensitivity_level.value if hasattr(routing_result.privacy_scan, 'sensitivity_level') else "low",
-            pii_detected=routing_result.privacy_scan.contains_pii if hasattr(routing_result.privacy_scan, 'contains_pii') else False,
+            sensitivity_level=routing_result.privacy_scan.sensitivity_level.value,
+            pii_detected=bool(routing_result.privacy_scan.pii_found),
             document_attached=request.file_attached,
             model_used=model_id,
-            model_provider=routing_result.selected_model.provider.value if hasattr(routing_result.selected_model, 'provider') else "local",
-            audit_id=routing_result.audit_id if hasattr(routing_result, 'audit_id') else "",
+            model_provider=routing_result.selected_model.provider.value,
+            audit_id=routing_result.audit_id,
         )
         
         cost_info = CostInfo(
             estimated_cost_usd=routing_result.estimated_cost,
-            estimated_cost_inr=routing_result.estimated_cost * 83,
+            estimated_cost_inr=routing_result.estimated_cost * _USD_TO_INR,
             saved_vs_cloud_usd=routing_result.cost_saved_vs_cloud,
-            saved_vs_cloud_inr=routing_result.cost_saved_vs_cloud * 83,
+            saved_vs_cloud_inr=routing_result.cost_saved_vs_cloud * _USD_TO_INR,
         )
         
-        # Log audit (using the sync log method)
-        audit_logger.log(
+        # Log audit in the background (off the response critical path)
+        _log_audit_background(
             routing_result=routing_result,
             content=request.messages[-1].content if request.messages else "",
             session_id=request.session_id,
@@ -667,19 +699,24 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
         )
         
         # DEBUG: Log response
-        print(f"[TRUST_CHAT] Response content length: {len(response_content)}")
-        print(f"[TRUST_CHAT] Response content preview: {response_content[:200] if response_content else 'EMPTY'}")
-        # Try to persist session, but don't fail if DB is unavailable
-        session_id = request.session_id or str(uuid.uuid4())
+        if settings.DEBUG:
+            logger.debug(
+                "trust_chat_response",
+                content_preview=response_content[:200],
+                response_len=len(response_content),
+            )
+        # Collect the session upsert started before inference; don't fail if
+        # DB is unavailable
+        session_id = request.session_id or uuid.uuid4().hex
         try:
-            if db is not None:
-                session_id = await session_store.ensure_session(db, request.session_id, request.user_id)
+            if session_task is not None:
+                session_id = await session_task
         except Exception as db_error:
             logger.warning("session_store_unavailable", error=str(db_error))
             # Continue without DB persistence - chat still works
         
         response_obj = TrustChatResponse(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             session_id=session_id,
             message=Message(
                 role=MessageRole.ASSISTANT,
@@ -693,35 +730,23 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
         )
 
 
-        # Persist last user + assistant messages for resume (optional - don't fail if DB unavailable)
+        # Persist last user + assistant messages for resume in the background
+        # (optional - don't fail or wait on the response path if DB unavailable)
         if db is not None:
-            try:
-                if request.messages:
-                    last_user = request.messages[-1]
-                    await session_store.append_message(
-                        db,
-                        session_id=session_id,
-                        role=last_user.role.value,
-                        content=last_user.content,
-                    )
-                await session_store.append_message(
-                    db,
-                    session_id=session_id,
-                    role=MessageRole.ASSISTANT.value,
-                    content=response_content,
-                    metadata={
-                        "model": model_id,
-                        "trust": response_obj.trust.model_dump(),
-                        "cost": response_obj.cost.model_dump(),
-                    },
-                )
-                await db.commit()
-            except Exception as persist_error:
-                logger.warning("message_persistence_failed", error=str(persist_error))
-
-        # DEBUG: Log full response object
-        print(f"[TRUST_CHAT] Response object message.content: {response_obj.message.content[:200] if response_obj.message.content else 'EMPTY'}")
-        print(f"[TRUST_CHAT] Response as dict: {response_obj.model_dump()}")
+            persist_task = asyncio.create_task(_persist_messages(
+                session_id,
+                request.messages[-1] if request.messages else None,
+                response_content,
+                {
+                    "model": model_id,
+                    # All fields are JSON-safe scalars/lists, so the plain
+                    # attribute dict avoids a second model_dump() traversal
+                    "trust": dict(trust_info.__dict__),
+                    "cost": dict(cost_info.__dict__),
+                },
+            ))
+            _background_tasks.add(persist_task)
+            persist_task.add_done_callback(_background_tasks.discard)
 
         return response_obj
 
@@ -730,30 +755,151 @@ async def create_trust_chat_completion(request: TrustChatRequest, db: Optional[A
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/trust/completions/stream")
+async def create_trust_chat_completion_stream(request: TrustChatRequest):
+    """
+    Stream a privacy-first chat completion as Server-Sent Events.
+
+    Same trust-aware routing as /trust/completions, but tokens are
+    yielded as the model emits them, so time-to-first-byte drops from
+    full-completion latency to first-token latency.
+    """
+    user_content = " ".join([
+        m.content for m in request.messages
+        if m.role == MessageRole.USER
+    ])
+
+    routing_result = trust_router.route(
+        content=user_content,
+        file_attached=request.file_attached,
+        file_name=request.file_name,
+        file_content=request.file_content,
+        user_model_preference=request.model,
+        force_local=request.force_local,
+        estimated_tokens=len(user_content.split()) * 2
+    )
+
+    _log_audit_background(
+        routing_result=routing_result,
+        content=user_content,
+        session_id=request.session_id,
+        user_id=request.user_id
+    )
+
+    model_id = routing_result.selected_model.model_id
+    selected_provider = routing_result.selected_model.provider
+
+    # Build provider messages once, prepending the legal system prompt if absent
+    stream_messages = [
+        {"role": m.role.value, "content": m.content}
+        for m in request.messages
+    ]
+    if not any(m["role"] == "system" for m in stream_messages):
+        stream_messages.insert(0, {
+            "role": "system",
+            "content": get_legal_system_prompt(request.file_attached)
+        })
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        try:
+            if selected_provider == ModelProvider.OPENSOURCE and groq_client.is_available:
+                async for token in groq_client.stream_chat_completion(
+                    messages=stream_messages,
+                    model=model_id,
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens or 4096,
+                ):
+                    yield f"data: {json.dumps({'delta': token})}\n\n"
+            elif routing_result.is_local and await ollama_client.health_check():
+                ollama_model = get_ollama_model_name(model_id)
+                system = next(
+                    (m["content"] for m in stream_messages if m["role"] == "system"),
+                    None
+                )
+                prompt = "\n\n".join(
+                    m["content"] for m in stream_messages if m["role"] != "system"
+                )
+                async for token in ollama_client.stream_generate(
+                    model=ollama_model,
+                    prompt=prompt,
+                    system=system,
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens or 4096,
+                ):
+                    yield f"data: {json.dumps({'delta': token})}\n\n"
+            elif groq_client.is_available:
+                # Open-source fallback keeps data off proprietary clouds
+                async for token in groq_client.stream_chat_completion(
+                    messages=stream_messages,
+                    model="llama-3.1-8b-instant",
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens or 4096,
+                ):
+                    yield f"data: {json.dumps({'delta': token})}\n\n"
+            else:
+                yield f"data: {json.dumps({'error': 'No streaming-capable model available'})}\n\n"
+                return
+
+            done_event = {
+                "done": True,
+                "model": model_id,
+                "trust_badge": routing_result.trust_badge,
+                "is_local": routing_result.is_local,
+            }
+            yield f"data: {json.dumps(done_event)}\n\n"
+        except Exception as e:
+            logger.error("trust_chat_stream_error", error=str(e))
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+# Dashboard/stats snapshots: UIs poll these every second or two, so serve a
+# pre-serialized snapshot and only rebuild after the TTL lapses
+_SNAPSHOT_TTL_S = 2.0
+_snapshots: dict = {}
+
+
+def _cached_snapshot(key: str, build) -> bytes:
+    """Return cached orjson bytes for `key`, rebuilding via `build()` on expiry."""
+    now = time.monotonic()
+    cached = _snapshots.get(key)
+    if cached is not None and now - cached[1] < _SNAPSHOT_TTL_S:
+        return cached[0]
+
+    payload = orjson.dumps(build())
+    _snapshots[key] = (payload, now)
+    return payload
+
+
 @router.get("/trust/dashboard")
 async def get_trust_dashboard():
     """
     Get trust dashboard data for UI.
     Shows users their privacy is protected.
     """
-    return audit_logger.get_trust_dashboard_data()
+    payload = _cached_snapshot("dashboard", audit_logger.get_trust_dashboard_data)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/trust/stats")
 async def get_trust_stats():
     """Get privacy and cost statistics."""
-    return audit_logger.get_stats()
+    payload = _cached_snapshot("stats", audit_logger.get_stats)
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/trust/models")
-async def list_trust_models():
+@lru_cache(maxsize=1)
+def _trust_models_payload() -> bytes:
     """
-    List available models with trust classification.
-    Shows which models are local vs cloud.
+    Serialize the /trust/models payload once.
+
+    The model registry is fixed at import time, so the payload only
+    needs to be built and serialized on the first request.
     """
     models = trust_router.get_available_models()
-    
-    return {
+
+    return orjson.dumps({
         "models": [
             {
                 "id": m.model_id,
@@ -762,23 +908,27 @@ async def list_trust_models():
                 "is_local": m.provider.value == "local",
                 "context_window": m.context_window,
                 "cost_per_1k_tokens": m.cost_per_1k_tokens,
-                "cost_per_1k_tokens_inr": m.cost_per_1k_tokens * 83,
+                "cost_per_1k_tokens_inr": m.cost_per_1k_tokens * _USD_TO_INR,
                 "capabilities": m.capabilities,
                 "trust_badge": "🔒 SECURE LOCAL" if m.provider.value == "local" else "☁️ CLOUD",
             }
             for m in models.values()
         ],
         "trust_summary": trust_router.get_trust_summary()
-    }
+    })
 
 
-@router.get("/trust/routing-rules")
-async def get_routing_rules():
+@router.get("/trust/models")
+async def list_trust_models():
     """
-    Get routing rules for transparency.
-    Users can see exactly how their data is routed.
+    List available models with trust classification.
+    Shows which models are local vs cloud.
     """
-    return {
+    return Response(content=_trust_models_payload(), media_type="application/json")
+
+
+# Routing rules are static - serialized once at import time
+_ROUTING_RULES_BYTES = orjson.dumps({
         "rules": [
             {
                 "rule": "Document Upload",
@@ -822,4 +972,13 @@ async def get_routing_rules():
             "Full audit trail for compliance",
             "User always knows where data is processed",
         ]
-    }
+    })
+
+
+@router.get("/trust/routing-rules")
+async def get_routing_rules():
+    """
+    Get routing rules for transparency.
+    Users can see exactly how their data is routed.
+    """
+    return Response(content=_ROUTING_RULES_BYTES, media_type="application/json")
@@ -3,14 +3,17 @@ Database configuration and session management for async SQLAlchemy.
 Adds a resilient fallback to SQLite when Postgres is unavailable.
 """
 
+import asyncio
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncGenerator, Optional
 import os
 import structlog
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import DisconnectionError, OperationalError
 
 from app.config import settings
 
@@ -22,6 +25,7 @@ class Base(DeclarativeBase):
     """Base class for SQLAlchemy models."""
 
 
+@lru_cache(maxsize=8)
 def _normalize_url(url: str) -> str:
     """Ensure async driver is used for Postgres; pass-through otherwise."""
     if url.startswith("postgresql://") or url.startswith("postgres://"):
@@ -35,12 +39,16 @@ def _create_engine(url: str):
     normalized = _normalize_url(url)
     # Use connection pooling settings suitable for Railway
     return create_async_engine(
-        normalized, 
-        echo=False, 
+        normalized,
+        echo=False,
         future=True,
         pool_size=5,
         max_overflow=10,
-        pool_pre_ping=True,  # Verify connections before use
+        # No pre-ping: it costs a SELECT 1 round-trip on every checkout.
+        # The background idle checker pings pooled connections instead, so
+        # server-side disconnects are found off the request path, and
+        # pool_recycle ages out old connections at checkout without I/O.
+        pool_pre_ping=False,
         pool_recycle=300,  # Recycle connections every 5 minutes
     )
 
@@ -49,6 +57,11 @@ def _create_engine(url: str):
 engine = None
 SessionLocal = None
 
+# How often the background checker pings idle pooled connections
+IDLE_CHECK_INTERVAL = 60
+
+_idle_check_task: Optional[asyncio.Task] = None
+
 
 async def init_db() -> None:
     """Initialize database; fallback to SQLite if Postgres is down."""
@@ -67,6 +80,8 @@ async def init_db() -> None:
                 # Ignore "already exists" races when multiple processes initialize
                 if "already exists" not in str(oe).lower():
                     raise
+        await _warm_pool()
+        _start_idle_checker()
         logger.info("database_init_complete", url=_normalize_url(settings.DATABASE_URL))
     except Exception as e:
         logger.error("database_init_failed", error=str(e), url=_normalize_url(settings.DATABASE_URL))
@@ -85,6 +100,85 @@ async def init_db() -> None:
         logger.info("sqlite_init_complete", path=sqlite_path)
 
 
+async def run_with_retry(op, attempts: int = 2):
+    """
+    Run `op` (an async callable taking a session) and retry once on
+    connection-level errors with a fresh session.
+
+    Complements the background idle checker: a write that still lands on
+    a connection that died between pings pays for a reconnect instead of
+    failing outright.
+    """
+    for attempt in range(attempts):
+        try:
+            async with get_session() as session:
+                return await op(session)
+        except (DisconnectionError, OperationalError) as e:
+            if attempt + 1 >= attempts:
+                raise
+            logger.warning("db_operation_retry", error=str(e))
+
+
+async def _ping_pool(count: int = 5) -> None:
+    """
+    Check out `count` pooled connections in parallel and ping each one.
+    A dead connection fails its ping and SQLAlchemy invalidates it, so
+    the pool reconnects instead of handing it to a request.
+    """
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    results = await asyncio.gather(*[_ping() for _ in range(count)], return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+async def _warm_pool(count: int = 5) -> None:
+    """
+    Eagerly establish `count` pooled connections in parallel so the first
+    burst of requests doesn't each pay connect + auth latency.
+    """
+    try:
+        await _ping_pool(count)
+    except Exception as e:
+        # Warm-up is best-effort; connections will be opened lazily instead
+        logger.warning("pool_prewarm_failed", error=str(e))
+
+
+def _start_idle_checker() -> None:
+    """Start (or restart) the background idle-connection checker."""
+    global _idle_check_task
+    if _idle_check_task is not None:
+        _idle_check_task.cancel()
+    _idle_check_task = asyncio.create_task(_idle_check_loop())
+
+
+async def _idle_check_loop() -> None:
+    """
+    Periodically ping idle pooled connections so ones the server dropped
+    (e.g. Railway killing idle connections) are replaced in the
+    background rather than surfacing as request failures. Together with
+    pool_recycle this replaces the per-checkout pre-ping.
+    """
+    while True:
+        await asyncio.sleep(IDLE_CHECK_INTERVAL)
+        try:
+            await _ping_pool()
+        except Exception as e:
+            # The failed pings already invalidated the dead connections
+            logger.warning("pool_idle_check_failed", error=str(e))
+
+
+async def close_db() -> None:
+    """Stop the idle checker (call on app shutdown)."""
+    global _idle_check_task
+    if _idle_check_task is not None:
+        _idle_check_task.cancel()
+        _idle_check_task = None
+
+
 @asynccontextmanager
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide an async database session as a context manager."""
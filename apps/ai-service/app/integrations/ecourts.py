@@ -3,13 +3,15 @@ eCourts India Integration
 Fetches case status, hearing dates, and court information from eCourts portal
 """
 
-import httpx
 import re
-from typing import Optional, List, Dict, Any
-from bs4 import BeautifulSoup
+from typing import Optional, List, Dict, Any, NamedTuple
 from datetime import datetime
 import logging
 
+# No top-level httpx/bs4 imports: every method here returns static stubs
+# until official eCourts API access is wired up, and bs4 alone costs ~100ms
+# of cold-start import time. Import inside the method that first needs them.
+
 logger = logging.getLogger(__name__)
 
 # Indian state codes for eCourts
@@ -45,6 +47,20 @@ STATE_CODES = {
     "delhi": "29",
 }
 
+# 12 alphanumerics followed by a plausible year (1950-2100); one C-level
+# scan replaces the length/isalnum/int-parse sequence in validate_cnr
+_CNR_RE = re.compile(r'[A-Z0-9]{12}(19[5-9]\d|20\d{2}|2100)')
+
+
+class CNRParts(NamedTuple):
+    """Parsed components of a 16-character CNR number."""
+    state_code: str
+    court_complex_code: str
+    establishment_code: str
+    case_sequence: str
+    year: str
+    full_cnr: str
+
 class ECourtsClient:
     """Client for fetching case information from eCourts India"""
     
@@ -202,46 +218,22 @@ class ECourtsClient:
             "portal_url": f"https://services.ecourts.gov.in/ecourtindia_v6/?p=casestatus/index&CNR={cnr_number}"
         }]
     
-    def parse_cnr(self, cnr_number: str) -> Dict[str, str]:
+    def parse_cnr(self, cnr_number: str) -> CNRParts:
         """
         Parse CNR number into components
-        
+
         Args:
             cnr_number: 16-digit CNR
-        
+
         Returns:
-            Dictionary with parsed components
+            CNRParts named tuple; call ._asdict() where a dict is needed
         """
         cnr = cnr_number.strip().upper()
-        
-        return {
-            "state_code": cnr[:2],
-            "court_complex_code": cnr[2:4],
-            "establishment_code": cnr[4:6],
-            "case_sequence": cnr[6:12],
-            "year": cnr[12:16],
-            "full_cnr": cnr
-        }
+        return CNRParts(cnr[:2], cnr[2:4], cnr[4:6], cnr[6:12], cnr[12:16], cnr)
     
     def validate_cnr(self, cnr_number: str) -> bool:
         """Validate CNR number format"""
-        cnr = cnr_number.strip().upper()
-        
-        if len(cnr) != 16:
-            return False
-        
-        if not cnr.isalnum():
-            return False
-        
-        # Check year is valid
-        try:
-            year = int(cnr[-4:])
-            if year < 1950 or year > 2100:
-                return False
-        except ValueError:
-            return False
-        
-        return True
+        return bool(_CNR_RE.fullmatch(cnr_number.strip().upper()))
 
 
 # NJDG (National Judicial Data Grid) Integration
@@ -3,21 +3,62 @@ Indian Kanoon Integration
 Fetches case laws, bare acts, and legal resources from Indian Kanoon
 """
 
+import asyncio
 import httpx
 import re
+import time
 from typing import Optional, List, Dict, Any
 from bs4 import BeautifulSoup
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml backend - several times faster than the pure-Python
+# html.parser on Indian Kanoon's large result/judgment pages
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Prefer selectolax's Lexbor engine over BeautifulSoup entirely when present:
+# tree building and CSS selection happen in C, roughly an order of magnitude
+# faster than BS4 even on the lxml backend
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# Compiled once at import: skips the re-cache lookup per result and the
+# per-pattern .lower() allocations in the metadata scan
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_COURT_PATTERNS = [
+    (re.compile(re.escape(pattern), re.IGNORECASE), code)
+    for pattern, code in [
+        ("Supreme Court", "supremecourt"),
+        ("High Court", "highcourt"),
+        ("Delhi", "delhi"),
+        ("Bombay", "bombay"),
+        ("Madras", "madras"),
+        ("Calcutta", "calcutta"),
+    ]
+]
+
 class IndianKanoonClient:
     """Client for fetching legal resources from Indian Kanoon"""
     
     BASE_URL = "https://indiankanoon.org"
     SEARCH_URL = f"{BASE_URL}/search/"
+
+    # Hot queries repeat (find_related_cases on the same section, user
+    # re-searches); judgments themselves are immutable
+    SEARCH_CACHE_TTL_S = 900
+    DOC_CACHE_TTL_S = 3600
+    CACHE_MAX_ENTRIES = 1024
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: int = 16):
         self.api_key = api_key
         self.headers = {
             "User-Agent": "LawSphere Legal-Tech Platform/1.0",
@@ -25,6 +66,87 @@ class IndianKanoonClient:
         }
         if api_key:
             self.headers["Authorization"] = f"Token {api_key}"
+
+        # Shared pooled client (created lazily) so keep-alive connections are
+        # reused instead of paying a TCP+TLS handshake per call
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Cap in-flight requests so unbounded fan-out can't exhaust file
+        # descriptors or trip indiankanoon.org rate limits
+        self._sem = asyncio.BoundedSemaphore(max_concurrency)
+
+        # In-memory TTL caches: hits skip the network and the HTML parse
+        self._search_cache: Dict[tuple, tuple] = {}
+        self._doc_cache: Dict[str, tuple] = {}
+
+        # Earliest monotonic time the next request may go out; pushed
+        # forward whenever the server sends Retry-After
+        self._next_request_at = 0.0
+
+    @classmethod
+    def _cache_get(cls, cache: dict, key, ttl: float):
+        """Return the cached value for key, or None if missing/expired"""
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < ttl:
+            return entry[0]
+        return None
+
+    @classmethod
+    def _cache_put(cls, cache: dict, key, value) -> None:
+        """Store value; evict the oldest entry once the cache is full"""
+        if len(cache) >= cls.CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[key] = (value, time.monotonic())
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the shared connection-pooled HTTP client"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                headers=self.headers,
+                follow_redirects=True,
+                # HTTP/2 multiplexes concurrent document fetches over one
+                # TCP/TLS connection instead of serializing per connection
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=64),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close pooled connections (call on app shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @retry(
+        retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(4),
+        reraise=True,
+    )
+    async def _request(self, url: str, params: Optional[dict] = None) -> httpx.Response:
+        """GET with per-host pacing and jittered exponential backoff"""
+        # Honor any server-requested delay before issuing the call
+        delay = self._next_request_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        client = self._get_client()
+        async with self._sem:
+            response = await client.get(url, params=params)
+
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After")
+            try:
+                pause = float(retry_after) if retry_after else 1.0
+            except ValueError:
+                pause = 1.0
+            self._next_request_at = max(self._next_request_at, time.monotonic() + pause)
+            response.raise_for_status()
+        elif response.status_code >= 500:
+            # Transient server errors are worth a retry; 4xx are not
+            response.raise_for_status()
+        return response
     
     async def search(
         self, 
@@ -49,9 +171,14 @@ class IndianKanoonClient:
         Returns:
             List of search results with title, citation, summary, url
         """
+        cache_key = (query, doc_type, court, from_year, to_year, max_results)
+        cached = self._cache_get(self._search_cache, cache_key, self.SEARCH_CACHE_TTL_S)
+        if cached is not None:
+            return cached
+
         try:
             params = {"formInput": query, "pagenum": 0}
-            
+
             if doc_type:
                 params["formInput"] += f" doctype:{doc_type}"
             if court:
@@ -61,101 +188,127 @@ class IndianKanoonClient:
             if to_year:
                 params["formInput"] += f" todate:{to_year}-12-31"
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    self.SEARCH_URL,
-                    params=params,
-                    headers=self.headers,
-                    follow_redirects=True
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"Indian Kanoon search failed: {response.status_code}")
-                    return []
-                
-                return self._parse_search_results(response.text, max_results)
-                
+            response = await self._request(self.SEARCH_URL, params=params)
+
+            if response.status_code != 200:
+                logger.error(f"Indian Kanoon search failed: {response.status_code}")
+                return []
+
+            # response.content hands the raw bytes straight to the parser;
+            # response.text would decode the whole page to str first only for
+            # lxml/Lexbor to re-encode it internally
+            results = self._parse_search_results(response.content, max_results)
+            self._cache_put(self._search_cache, cache_key, results)
+            return results
+
+
         except Exception as e:
             logger.error(f"Indian Kanoon search error: {e}")
             return []
     
-    def _parse_search_results(self, html: str, max_results: int) -> List[Dict[str, Any]]:
+    def _build_result(self, title: str, url: str, snippet: str, meta_text: str) -> Dict[str, Any]:
+        """Build a search-result dict from the extracted text fields"""
+        # Extract doc ID from URL
+        doc_id = url.split('/')[-1] if url else None
+
+        # Parse court and date from metadata
+        court = None
+        year = None
+
+        if meta_text:
+            # Try to extract year
+            year_match = _YEAR_RE.search(meta_text)
+            if year_match:
+                year = int(year_match.group())
+
+            # Common court names
+            for pattern, code in _COURT_PATTERNS:
+                if pattern.search(meta_text):
+                    court = code
+                    break
+
+        # Determine document type
+        doc_type = "CASE_LAW"
+        if "Act" in title or "Section" in title:
+            doc_type = "STATUTE"
+        elif "Rules" in title:
+            doc_type = "STATUTE"
+
+        return {
+            "id": doc_id,
+            "title": title,
+            "url": url,
+            "snippet": snippet,
+            "court": court,
+            "year": year,
+            "type": doc_type,
+            "source": "indian_kanoon",
+            "metadata": meta_text
+        }
+
+    def _parse_search_results(self, html: bytes, max_results: int) -> List[Dict[str, Any]]:
         """Parse search results HTML into structured data"""
+        if HAS_SELECTOLAX:
+            return self._parse_search_results_lexbor(html, max_results)
+
         results = []
-        soup = BeautifulSoup(html, 'html.parser')
-        
+        soup = BeautifulSoup(html, HTML_PARSER)
+
         # Find result items
         result_divs = soup.find_all('div', class_='result')
-        
+
         for div in result_divs[:max_results]:
             try:
                 # Extract title and link
                 title_elem = div.find('a', class_='result_title')
                 if not title_elem:
                     continue
-                
+
                 title = title_elem.get_text(strip=True)
                 url = self.BASE_URL + title_elem.get('href', '')
-                
-                # Extract doc ID from URL
-                doc_id = url.split('/')[-1] if url else None
-                
+
                 # Extract snippet/summary
                 snippet_elem = div.find('div', class_='result_text')
                 snippet = snippet_elem.get_text(strip=True)[:500] if snippet_elem else ""
-                
+
                 # Extract metadata (court, date)
                 meta_elem = div.find('div', class_='docsource')
                 meta_text = meta_elem.get_text(strip=True) if meta_elem else ""
-                
-                # Parse court and date from metadata
-                court = None
-                date = None
-                year = None
-                
-                if meta_text:
-                    # Try to extract year
-                    year_match = re.search(r'\b(19|20)\d{2}\b', meta_text)
-                    if year_match:
-                        year = int(year_match.group())
-                    
-                    # Common court names
-                    court_patterns = [
-                        ("Supreme Court", "supremecourt"),
-                        ("High Court", "highcourt"),
-                        ("Delhi", "delhi"),
-                        ("Bombay", "bombay"),
-                        ("Madras", "madras"),
-                        ("Calcutta", "calcutta"),
-                    ]
-                    for pattern, code in court_patterns:
-                        if pattern.lower() in meta_text.lower():
-                            court = code
-                            break
-                
-                # Determine document type
-                doc_type = "CASE_LAW"
-                if "Act" in title or "Section" in title:
-                    doc_type = "STATUTE"
-                elif "Rules" in title:
-                    doc_type = "STATUTE"
-                
-                results.append({
-                    "id": doc_id,
-                    "title": title,
-                    "url": url,
-                    "snippet": snippet,
-                    "court": court,
-                    "year": year,
-                    "type": doc_type,
-                    "source": "indian_kanoon",
-                    "metadata": meta_text
-                })
-                
+
+                results.append(self._build_result(title, url, snippet, meta_text))
+
             except Exception as e:
                 logger.warning(f"Failed to parse result: {e}")
                 continue
-        
+
+        return results
+
+    def _parse_search_results_lexbor(self, html: bytes, max_results: int) -> List[Dict[str, Any]]:
+        """Lexbor (selectolax) variant of _parse_search_results"""
+        results = []
+        tree = LexborHTMLParser(html)
+
+        for div in tree.css('div.result')[:max_results]:
+            try:
+                title_elem = div.css_first('a.result_title')
+                if title_elem is None:
+                    continue
+
+                title = title_elem.text(strip=True)
+                url = self.BASE_URL + (title_elem.attributes.get('href') or '')
+
+                snippet_elem = div.css_first('div.result_text')
+                snippet = snippet_elem.text(strip=True)[:500] if snippet_elem else ""
+
+                meta_elem = div.css_first('div.docsource')
+                meta_text = meta_elem.text(strip=True) if meta_elem else ""
+
+                results.append(self._build_result(title, url, snippet, meta_text))
+
+            except Exception as e:
+                logger.warning(f"Failed to parse result: {e}")
+                continue
+
         return results
     
     async def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
@@ -168,29 +321,34 @@ class IndianKanoonClient:
         Returns:
             Document with full content, or None if not found
         """
+        cached = self._cache_get(self._doc_cache, doc_id, self.DOC_CACHE_TTL_S)
+        if cached is not None:
+            return cached
+
         try:
             url = f"{self.BASE_URL}/doc/{doc_id}/"
-            
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    url,
-                    headers=self.headers,
-                    follow_redirects=True
-                )
-                
-                if response.status_code != 200:
-                    return None
-                
-                return self._parse_document(response.text, doc_id, url)
-                
+
+            response = await self._request(url)
+
+            if response.status_code != 200:
+                return None
+
+            doc = self._parse_document(response.content, doc_id, url)
+            self._cache_put(self._doc_cache, doc_id, doc)
+            return doc
+
+
         except Exception as e:
             logger.error(f"Failed to fetch document {doc_id}: {e}")
             return None
     
-    def _parse_document(self, html: str, doc_id: str, url: str) -> Dict[str, Any]:
+    def _parse_document(self, html: bytes, doc_id: str, url: str) -> Dict[str, Any]:
         """Parse document HTML into structured data"""
-        soup = BeautifulSoup(html, 'html.parser')
-        
+        if HAS_SELECTOLAX:
+            return self._parse_document_lexbor(html, doc_id, url)
+
+        soup = BeautifulSoup(html, HTML_PARSER)
+
         # Extract title
         title_elem = soup.find('h2', class_='doc_title')
         title = title_elem.get_text(strip=True) if title_elem else "Unknown"
@@ -224,7 +382,37 @@ class IndianKanoonClient:
             "citations": citations,
             "source": "indian_kanoon"
         }
-    
+
+    def _parse_document_lexbor(self, html: bytes, doc_id: str, url: str) -> Dict[str, Any]:
+        """Lexbor (selectolax) variant of _parse_document"""
+        tree = LexborHTMLParser(html)
+
+        title_elem = tree.css_first('h2.doc_title')
+        title = title_elem.text(strip=True) if title_elem else "Unknown"
+
+        content_elem = tree.css_first('div.judgments') or tree.css_first('div.doc_content')
+        content = content_elem.text(strip=True) if content_elem else ""
+
+        bench_elem = tree.css_first('div.doc_bench')
+        bench = bench_elem.text(strip=True) if bench_elem else None
+
+        cite_elem = tree.css_first('div.doc_citations')
+        citations = [cite.text(strip=True) for cite in cite_elem.css('a')] if cite_elem else []
+
+        date_elem = tree.css_first('div.doc_date')
+        date = date_elem.text(strip=True) if date_elem else None
+
+        return {
+            "id": doc_id,
+            "title": title,
+            "url": url,
+            "content": content[:50000],  # Limit content size
+            "bench": bench,
+            "date": date,
+            "citations": citations,
+            "source": "indian_kanoon"
+        }
+
     async def get_section(self, act: str, section: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a specific section of an act
@@ -249,19 +437,30 @@ class IndianKanoonClient:
         query = f'"{full_act}" section {section}'
         
         results = await self.search(query, doc_type="acts", max_results=5)
-        
-        if results:
-            # Get the most relevant result
-            for result in results:
-                if f"section {section}" in result["title"].lower():
-                    doc = await self.get_document(result["id"])
-                    if doc:
-                        return doc
-            
-            # Fall back to first result
-            return await self.get_document(results[0]["id"])
-        
-        return None
+
+        if not results:
+            return None
+
+        # Fetch all candidates concurrently (multiplexed over the shared
+        # client) instead of serializing one round-trip per result
+        docs = await asyncio.gather(
+            *(self.get_document(r["id"]) for r in results),
+            return_exceptions=True,
+        )
+
+        # Prefer the result whose title names the section; otherwise fall
+        # back to the first document that fetched successfully
+        section_marker = f"section {section}"
+        fallback = None
+        for result, doc in zip(results, docs):
+            if isinstance(doc, Exception) or doc is None:
+                continue
+            if fallback is None:
+                fallback = doc
+            if section_marker in result["title"].lower():
+                return doc
+
+        return fallback
     
     async def find_related_cases(
         self, 
@@ -296,3 +495,9 @@ def get_indian_kanoon_client() -> IndianKanoonClient:
         api_key = getattr(settings, 'INDIAN_KANOON_API_KEY', None)
         _client = IndianKanoonClient(api_key=api_key)
     return _client
+
+
+async def close_indian_kanoon_client() -> None:
+    """Close the singleton's pooled connections (app shutdown)"""
+    if _client is not None:
+        await _client.aclose()
@@ -17,7 +17,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Generate request ID
-        request_id = str(uuid.uuid4())
+        request_id = uuid.uuid4().hex
         
         # Start timer
         start_time = time.time()
@@ -2,52 +2,125 @@
 Rate limiting middleware.
 """
 
+import asyncio
 import time
-from typing import Callable, Dict
+from typing import Callable, Dict, Optional
 from fastapi import Request, Response, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
+import structlog
 
 from app.config import settings
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is in requirements
+    aioredis = None
+
+
+logger = structlog.get_logger()
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
-    Simple in-memory rate limiting middleware.
-    In production, use Redis for distributed rate limiting.
+    Rate limiting middleware backed by Redis when available.
+
+    With multiple uvicorn workers an in-process dict is per-worker, so a
+    client could do N-workers times the configured limit. Redis INCR+EXPIRE
+    shares one counter across workers; the in-memory token bucket remains
+    as the fallback when Redis is unreachable.
     """
-    
+
+    # How long to stay on the in-memory fallback before probing Redis again
+    REDIS_RETRY_INTERVAL = 30
+
     def __init__(self, app):
         super().__init__(app)
-        self.requests: Dict[str, list] = {}
+        # Token bucket per client: (tokens, last_refill_ts). Constant memory
+        # per client regardless of traffic, no timestamp history to prune.
+        self.buckets: Dict[str, tuple] = {}
         self.rate_limit = settings.RATE_LIMIT_REQUESTS
         self.rate_period = settings.RATE_LIMIT_PERIOD
+        self.refill_rate = self.rate_limit / self.rate_period
+        self._gc_task: Optional[asyncio.Task] = None
+        self._redis = aioredis.from_url(settings.REDIS_URL) if aioredis else None
+        # When Redis last failed; None while healthy. A failure switches to
+        # the in-memory fallback, and the next request after the retry
+        # interval probes Redis again rather than latching the fallback
+        self._redis_down_since: Optional[float] = None
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        # Lazily start the GC loop on the running event loop (the middleware
+        # is constructed before the loop exists)
+        if self._gc_task is None:
+            self._gc_task = asyncio.create_task(self._gc_loop())
+
         # Skip rate limiting for health checks
         if request.url.path in ["/health", "/ready", "/live", "/metrics"]:
             return await call_next(request)
         
         # Get client identifier
         client_id = self._get_client_id(request)
-        
-        # Check rate limit
-        if not self._is_allowed(client_id):
+
+        # Check rate limit: shared Redis counter first, local bucket fallback
+        remaining: Optional[int] = None
+        allowed: Optional[bool] = None
+        if self._redis_usable():
+            try:
+                allowed, remaining = await self._is_allowed_redis(client_id)
+                if self._redis_down_since is not None:
+                    self._redis_down_since = None
+                    logger.info("rate_limit_redis_recovered")
+            except Exception as e:
+                # Redis down: degrade to per-worker limiting rather than
+                # fail, and retry after REDIS_RETRY_INTERVAL
+                self._redis_down_since = time.time()
+                logger.warning("rate_limit_redis_degraded", error=str(e))
+        if allowed is None:
+            allowed = self._is_allowed(client_id)
+
+        if not allowed:
             raise HTTPException(
                 status_code=429,
                 detail="Rate limit exceeded. Please try again later.",
             )
-        
+
         # Process request
         response = await call_next(request)
-        
+
         # Add rate limit headers
-        remaining = self._get_remaining(client_id)
+        if remaining is None:
+            remaining = self._get_remaining(client_id)
         response.headers["X-RateLimit-Limit"] = str(self.rate_limit)
         response.headers["X-RateLimit-Remaining"] = str(remaining)
         response.headers["X-RateLimit-Reset"] = str(int(time.time()) + self.rate_period)
         
         return response
     
+    async def _gc_loop(self) -> None:
+        """Periodically evict buckets for clients idle longer than a period.
+
+        Without this, every unique client id ever seen stays in the dict for
+        the lifetime of the process.
+        """
+        while True:
+            await asyncio.sleep(self.rate_period)
+            now = time.time()
+            # Collect first, delete after: keeps dict iteration safe
+            idle = [
+                cid for cid, (_, last_ts) in self.buckets.items()
+                if now - last_ts >= self.rate_period
+            ]
+            for cid in idle:
+                del self.buckets[cid]
+
+    def _redis_usable(self) -> bool:
+        """Redis is configured and healthy, or due for a retry probe."""
+        if self._redis is None:
+            return False
+        if self._redis_down_since is None:
+            return True
+        return time.time() - self._redis_down_since >= self.REDIS_RETRY_INTERVAL
+
     def _get_client_id(self, request: Request) -> str:
         """Get client identifier from request."""
         # Use API key if available, otherwise use IP
@@ -58,29 +131,38 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         client_ip = request.client.host if request.client else "unknown"
         return f"ip:{client_ip}"
     
+    async def _is_allowed_redis(self, client_id: str) -> tuple:
+        """Fixed-window check via atomic INCR + EXPIRE, one round-trip."""
+        now = time.time()
+        bucket = int(now // self.rate_period)
+        key = f"ratelimit:{client_id}:{bucket}"
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, self.rate_period, nx=True)
+            count, _ = await pipe.execute()
+        return count <= self.rate_limit, max(0, self.rate_limit - count)
+
     def _is_allowed(self, client_id: str) -> bool:
         """Check if request is allowed under rate limit."""
         now = time.time()
-        
-        # Clean old entries
-        if client_id in self.requests:
-            self.requests[client_id] = [
-                t for t in self.requests[client_id]
-                if now - t < self.rate_period
-            ]
+
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
+            tokens = float(self.rate_limit)
         else:
-            self.requests[client_id] = []
-        
-        # Check limit
-        if len(self.requests[client_id]) >= self.rate_limit:
+            tokens, last_ts = bucket
+            tokens = min(float(self.rate_limit), tokens + (now - last_ts) * self.refill_rate)
+
+        if tokens < 1.0:
+            self.buckets[client_id] = (tokens, now)
             return False
-        
-        # Record request
-        self.requests[client_id].append(now)
+
+        self.buckets[client_id] = (tokens - 1.0, now)
         return True
-    
+
     def _get_remaining(self, client_id: str) -> int:
         """Get remaining requests for client."""
-        if client_id not in self.requests:
+        bucket = self.buckets.get(client_id)
+        if bucket is None:
             return self.rate_limit
-        return max(0, self.rate_limit - len(self.requests[client_id]))
+        return max(0, int(bucket[0]))
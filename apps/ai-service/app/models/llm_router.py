@@ -2,8 +2,13 @@
 Multi-LLM Router for intelligent model selection.
 """
 
+import asyncio
+import re
+import time
+from collections import deque
 from enum import Enum
 from typing import Optional
+import httpx
 from langchain_openai import ChatOpenAI
 try:
     from langchain_anthropic import ChatAnthropic
@@ -15,6 +20,27 @@ from langchain_core.language_models import BaseChatModel
 
 from app.config import settings
 
+# One pooled client shared by every provider that accepts an external
+# transport: lifts the default 100-connection cap and multiplexes over
+# HTTP/2 instead of opening a fresh pool per provider instance
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_http_client() -> httpx.AsyncClient:
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            limits=httpx.Limits(max_connections=2000, max_keepalive_connections=1500),
+        )
+    return _shared_http_client
+
+
+# One case-insensitive DFA pass over the query instead of N substring
+# scans of a freshly lowercased copy per routing call
+_LEGAL_RE = re.compile(r"\b(?:analyze|research|precedent|statute|case\s+law)\b", re.IGNORECASE)
+
 
 class ModelType(str, Enum):
     GPT4 = "gpt-4"
@@ -111,6 +137,54 @@ class ModelConfig:
         return cls.CONFIGS.get(model_type, cls.CONFIGS[ModelType.GPT4O])
 
 
+def _build_openai(model_name: str, temperature: float, max_tokens: int) -> BaseChatModel:
+    return ChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_key=settings.OPENAI_API_KEY,
+        http_async_client=_get_shared_http_client(),
+    )
+
+
+def _build_anthropic(model_name: str, temperature: float, max_tokens: int) -> BaseChatModel:
+    if not HAS_ANTHROPIC:
+        raise ImportError(
+            "Anthropic support not available. Install langchain-anthropic: "
+            "pip install langchain-anthropic"
+        )
+    return ChatAnthropic(
+        model=model_name,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        api_key=settings.ANTHROPIC_API_KEY,
+    )
+
+
+def _build_google(model_name: str, temperature: float, max_tokens: int) -> BaseChatModel:
+    return ChatGoogleGenerativeAI(
+        model=model_name,
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+        google_api_key=settings.GOOGLE_API_KEY,
+    )
+
+
+# Flattened at import for the routing hot path: one dict probe yields the
+# fields get_model needs, and provider dispatch is a lookup, not an
+# if/elif chain
+_BUILDERS = {
+    "openai": _build_openai,
+    "anthropic": _build_anthropic,
+    "google": _build_google,
+}
+_CONFIG_TUPLES: dict[ModelType, tuple] = {
+    mt: (c["provider"], c["model_name"], c["max_tokens"])
+    for mt, c in ModelConfig.CONFIGS.items()
+}
+_DEFAULT_CONFIG_TUPLE = _CONFIG_TUPLES[ModelType.GPT4O]
+
+
 class LLMRouter:
     """
     Routes requests to the appropriate LLM based on model selection.
@@ -118,8 +192,13 @@ class LLMRouter:
     """
     
     def __init__(self):
-        self._models: dict[ModelType, BaseChatModel] = {}
-    
+        # Keyed by (model_type, temperature, max_tokens): each provider
+        # instance owns an httpx client, so reusing one keeps its connection
+        # pool warm instead of redoing TLS per request
+        self._models: dict[tuple[ModelType, float, int], BaseChatModel] = {}
+        # Rolling (timestamp, success) outcomes per model for the breaker
+        self._outcomes: dict[ModelType, deque] = {}
+
     def get_model(
         self,
         model_type: ModelType,
@@ -127,42 +206,38 @@ class LLMRouter:
         max_tokens: Optional[int] = None,
     ) -> BaseChatModel:
         """Get or create an LLM instance for the specified model type."""
-        
-        config = ModelConfig.get_config(model_type)
-        max_tokens = max_tokens or config["max_tokens"]
-        
-        if config["provider"] == "openai":
-            return ChatOpenAI(
-                model=config["model_name"],
-                temperature=temperature,
-                max_tokens=max_tokens,
-                api_key=settings.OPENAI_API_KEY,
-            )
-        
-        elif config["provider"] == "anthropic":
-            if not HAS_ANTHROPIC:
-                raise ImportError(
-                    "Anthropic support not available. Install langchain-anthropic: "
-                    "pip install langchain-anthropic"
-                )
-            return ChatAnthropic(
-                model=config["model_name"],
-                temperature=temperature,
-                max_tokens=max_tokens,
-                api_key=settings.ANTHROPIC_API_KEY,
-            )
-        
-        elif config["provider"] == "google":
-            return ChatGoogleGenerativeAI(
-                model=config["model_name"],
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-                google_api_key=settings.GOOGLE_API_KEY,
-            )
-        
-        else:
-            raise ValueError(f"Unknown provider: {config['provider']}")
-    
+
+        provider, model_name, default_max = _CONFIG_TUPLES.get(
+            model_type, _DEFAULT_CONFIG_TUPLE
+        )
+        max_tokens = max_tokens or default_max
+
+        key = (model_type, temperature, max_tokens)
+        model = self._models.get(key)
+        if model is None:
+            builder = _BUILDERS.get(provider)
+            if builder is None:
+                raise ValueError(f"Unknown provider: {provider}")
+            model = builder(model_name, temperature, max_tokens)
+            self._models[key] = model
+        return model
+
+    async def aclose(self) -> None:
+        """Close the cached providers' underlying HTTP clients."""
+        for model in self._models.values():
+            async_client = getattr(model, "async_client", None)
+            close = getattr(async_client, "close", None)
+            if close is not None:
+                try:
+                    result = close()
+                    if hasattr(result, "__await__"):
+                        await result
+                except Exception:
+                    pass
+        self._models.clear()
+        if _shared_http_client is not None and not _shared_http_client.is_closed:
+            await _shared_http_client.aclose()
+
     def route_by_complexity(
         self,
         query: str,
@@ -180,14 +255,68 @@ class LLMRouter:
             return ModelType.CLAUDE_3_SONNET
         
         # Complex legal analysis
-        legal_keywords = ["analyze", "research", "precedent", "statute", "case law"]
-        if any(kw in query.lower() for kw in legal_keywords):
+        if _LEGAL_RE.search(query):
             return ModelType.GPT4
         
         # Default to configured model
         default_model = getattr(settings, 'DEFAULT_MODEL', 'gemini-pro')
         return ModelType(default_model)
     
+    # Circuit breaker: a model with a majority of failures in the rolling
+    # window is skipped so its tail latency stops dragging every request
+    FAILURE_WINDOW_S = 60.0
+    FAILURE_THRESHOLD = 0.5
+    MIN_SAMPLES = 4
+
+    def _record_outcome(self, model_type: ModelType, ok: bool) -> None:
+        window = self._outcomes.setdefault(model_type, deque(maxlen=64))
+        window.append((time.monotonic(), ok))
+
+    def _circuit_open(self, model_type: ModelType) -> bool:
+        window = self._outcomes.get(model_type)
+        if not window:
+            return False
+        cutoff = time.monotonic() - self.FAILURE_WINDOW_S
+        while window and window[0][0] < cutoff:
+            window.popleft()
+        if len(window) < self.MIN_SAMPLES:
+            return False
+        failures = sum(1 for _, ok in window if not ok)
+        return failures / len(window) > self.FAILURE_THRESHOLD
+
+    async def invoke_with_fallback(
+        self,
+        model_type: ModelType,
+        messages,
+        *,
+        timeout: float = 30.0,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+    ):
+        """Invoke a model, failing over along its fallback chain.
+
+        Each candidate gets a bounded wait so one provider's tail latency
+        never becomes the user's latency; models whose recent failure rate
+        trips the circuit breaker are skipped outright.
+        """
+        last_error: Optional[Exception] = None
+        for candidate in (model_type, *self.get_fallback_chain(model_type)):
+            if self._circuit_open(candidate):
+                continue
+            model = self.get_model(candidate, temperature, max_tokens)
+            try:
+                result = await asyncio.wait_for(model.ainvoke(messages), timeout)
+            except Exception as e:
+                self._record_outcome(candidate, False)
+                last_error = e
+                continue
+            self._record_outcome(candidate, True)
+            return result
+
+        raise last_error if last_error is not None else RuntimeError(
+            "All models in the fallback chain are circuit-broken"
+        )
+
     def get_fallback_chain(self, model_type: ModelType) -> list[ModelType]:
         """Get fallback models if the primary model fails."""
         fallbacks = {
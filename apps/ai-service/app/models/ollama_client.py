@@ -5,8 +5,14 @@ Handles communication with local Ollama server for privacy-first inference.
 
 import os
 import httpx
-import json
+import orjson
 import asyncio
+import statistics
+import threading
+import time
+import types
+from collections import deque
+import hashlib
 from typing import Optional, AsyncGenerator, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
@@ -14,7 +20,10 @@ import structlog
 
 logger = structlog.get_logger()
 
-# Ollama base URL from environment (for Docker support)
+# Ollama base URL from environment (for Docker support). A comma-separated
+# list enables multi-node affinity routing: Ollama's KV/prefix cache is
+# per-process, so pinning a (model, system prompt) pair to one node lets
+# repeated system prompts skip the prefill entirely.
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
 
@@ -50,6 +59,32 @@ class OllamaResponse:
         return 0.0
 
 
+class _LatencyTracker:
+    """Rolling per-model latency window for adaptive timeouts.
+
+    A fixed timeout sized for the slowest model makes every fast-path
+    request wait out the worst case before failing over; twice the
+    observed p95 bounds each model by its own behaviour instead.
+    """
+
+    MIN_SAMPLES = 8
+    MIN_TIMEOUT_S = 30.0
+
+    def __init__(self, maxlen: int = 256):
+        self._samples: Dict[str, deque] = {}
+        self._maxlen = maxlen
+
+    def record(self, model: str, seconds: float) -> None:
+        self._samples.setdefault(model, deque(maxlen=self._maxlen)).append(seconds)
+
+    def timeout_for(self, model: str, default: float) -> float:
+        samples = self._samples.get(model)
+        if samples is None or len(samples) < self.MIN_SAMPLES:
+            return default
+        p95 = statistics.quantiles(samples, n=20)[-1]
+        return max(self.MIN_TIMEOUT_S, min(default, p95 * 2))
+
+
 class OllamaClient:
     """
     Async client for Ollama local inference.
@@ -61,30 +96,85 @@ class OllamaClient:
     - Automatic model loading
     """
     
+    # Short-lived response cache: repeated boilerplate queries (same model,
+    # prompt and sampling settings) skip the 1-10s inference round-trip
+    RESPONSE_CACHE_TTL_S = 300
+    RESPONSE_CACHE_MAX = 512
+
     def __init__(
         self,
         base_url: str = None,
         timeout: float = 300.0  # 5 min timeout for CPU inference
     ):
-        self.base_url = (base_url or OLLAMA_BASE_URL).rstrip("/")
+        raw = base_url or OLLAMA_BASE_URL
+        self.base_urls = [u.strip().rstrip("/") for u in raw.split(",") if u.strip()]
+        self.base_url = self.base_urls[0]
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # /api/tags snapshot: (fetched_at, models, exact names, base names);
+        # routing checks model availability per request, so refetching every
+        # time doubles the HTTP traffic to the server
+        self._tags_cache: Optional[tuple] = None
+        self._tags_ttl = 30.0
+        self._response_cache: Dict[str, tuple] = {}
+        self._latency = _LatencyTracker()
         logger.info("ollama_client_init", base_url=self.base_url)
+
+    @staticmethod
+    def _response_cache_key(*parts: str) -> str:
+        """Fingerprint of the fields that determine a completion"""
+        return hashlib.blake2b("\x00".join(parts).encode(), digest_size=16).hexdigest()
+
+    def _response_cache_get(self, key: str) -> Optional["OllamaResponse"]:
+        entry = self._response_cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self.RESPONSE_CACHE_TTL_S:
+            return entry[0]
+        return None
+
+    def _response_cache_put(self, key: str, value: "OllamaResponse") -> None:
+        if len(self._response_cache) >= self.RESPONSE_CACHE_MAX:
+            self._response_cache.pop(next(iter(self._response_cache)))
+        self._response_cache[key] = (value, time.monotonic())
         
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=httpx.Timeout(self.timeout, connect=10.0)
+    def _select_node(self, model: str, system: str) -> str:
+        """Pick the node whose KV cache is warm for this (model, system) pair.
+
+        A stable hash keeps the same pair on the same node across requests,
+        so long system prompts are prefilled once per node instead of once
+        per request.
+        """
+        if len(self.base_urls) == 1:
+            return self.base_url
+        digest = hashlib.blake2b(f"{model}\x00{system}".encode(), digest_size=8).digest()
+        return self.base_urls[int.from_bytes(digest, "big") % len(self.base_urls)]
+
+    async def _get_client(self, base_url: Optional[str] = None) -> httpx.AsyncClient:
+        """Get or create the HTTP client for a node (default: primary)"""
+        base_url = base_url or self.base_url
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = self._clients[base_url] = httpx.AsyncClient(
+                base_url=base_url,
+                # Keep-alive + HTTP/2: concurrent inference calls reuse warm
+                # connections instead of paying a TCP handshake each
+                http2=True,
+                timeout=httpx.Timeout(self.timeout, connect=10.0),
+                transport=httpx.AsyncHTTPTransport(retries=3, http2=True),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=40,
+                    keepalive_expiry=30.0,
+                ),
+                headers={"Accept-Encoding": "gzip", "Connection": "keep-alive"},
             )
-        return self._client
-    
+        return client
+
     async def close(self):
-        """Close the HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Close all per-node HTTP clients"""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            if not client.is_closed:
+                await client.aclose()
     
     async def health_check(self) -> bool:
         """Check if Ollama server is running"""
@@ -97,13 +187,17 @@ class OllamaClient:
             return False
     
     async def list_models(self) -> List[OllamaModel]:
-        """List all available models"""
+        """List all available models (cached for a short TTL)"""
+        cache = self._tags_cache
+        if cache is not None and time.monotonic() - cache[0] < self._tags_ttl:
+            return cache[1]
+
         try:
             client = await self._get_client()
             response = await client.get("/api/tags")
             response.raise_for_status()
             data = response.json()
-            
+
             models = []
             for m in data.get("models", []):
                 models.append(OllamaModel(
@@ -112,20 +206,25 @@ class OllamaClient:
                     modified=m.get("modified_at", ""),
                     digest=m.get("digest", "")[:12]
                 ))
+
+            # Precompute the lookup sets is_model_available needs
+            names = {m.name for m in models}
+            bases = {m.name.split(":")[0] for m in models}
+            self._tags_cache = (time.monotonic(), models, names, bases)
             return models
         except Exception as e:
             logger.error("ollama_list_models_failed", error=str(e))
             return []
-    
+
     async def is_model_available(self, model_name: str) -> bool:
         """Check if a specific model is available"""
-        models = await self.list_models()
+        await self.list_models()
+        cache = self._tags_cache
+        if cache is None:
+            return False
+        _, _, names, bases = cache
         # Check both exact match and prefix match (e.g., "qwen2.5:7b" matches "qwen2.5")
-        return any(
-            m.name == model_name or 
-            m.name.startswith(model_name.split(":")[0])
-            for m in models
-        )
+        return model_name in names or model_name.split(":")[0] in bases
     
     async def pull_model(self, model_name: str) -> bool:
         """Pull a model from Ollama registry"""
@@ -137,6 +236,8 @@ class OllamaClient:
                 timeout=httpx.Timeout(600.0)  # 10 min for large models
             )
             response.raise_for_status()
+            # The tag list just changed; force a refetch on next lookup
+            self._tags_cache = None
             return True
         except Exception as e:
             logger.error("ollama_pull_model_failed", model=model_name, error=str(e))
@@ -165,9 +266,17 @@ class OllamaClient:
         Returns:
             OllamaResponse with generated content
         """
+        cache_key = self._response_cache_key(
+            "generate", model, system or "", prompt, f"{temperature:.2f}", str(max_tokens)
+        )
+        cached = self._response_cache_get(cache_key)
+        if cached is not None:
+            logger.info("ollama_generate_cache_hit", model=model)
+            return cached
+
         try:
-            client = await self._get_client()
-            
+            client = await self._get_client(self._select_node(model, system or ""))
+
             payload = {
                 "model": model,
                 "prompt": prompt,
@@ -182,8 +291,13 @@ class OllamaClient:
                 payload["system"] = system
             
             logger.info("ollama_generate_start", model=model, prompt_length=len(prompt))
-            
-            response = await client.post("/api/generate", json=payload)
+
+            started = time.monotonic()
+            response = await asyncio.wait_for(
+                client.post("/api/generate", json=payload),
+                timeout=self._latency.timeout_for(model, self.timeout),
+            )
+            self._latency.record(model, time.monotonic() - started)
             response.raise_for_status()
             data = response.json()
             
@@ -205,16 +319,51 @@ class OllamaClient:
                 tokens_per_sec=round(result.tokens_per_second, 2),
                 duration_ms=result.total_duration_ns / 1e6
             )
-            
+
+            self._response_cache_put(cache_key, result)
             return result
             
-        except httpx.TimeoutException:
+        except (httpx.TimeoutException, asyncio.TimeoutError):
             logger.error("ollama_generate_timeout", model=model)
             raise TimeoutError(f"Ollama request timed out for model {model}")
         except Exception as e:
             logger.error("ollama_generate_failed", model=model, error=str(e))
             raise
     
+    async def generate_batch(
+        self,
+        model: str,
+        prompts: List[str],
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        concurrency: int = 8,
+    ) -> List[OllamaResponse]:
+        """
+        Generate completions for many prompts concurrently.
+
+        Requests are fanned out with a bounded semaphore; actual server-side
+        parallelism additionally requires OLLAMA_NUM_PARALLEL>1 (and
+        OLLAMA_MAX_LOADED_MODELS when mixing models), otherwise Ollama
+        serializes the calls.
+
+        Returns:
+            OllamaResponse per prompt, in input order
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(prompt: str) -> OllamaResponse:
+            async with sem:
+                return await self.generate(
+                    model=model,
+                    prompt=prompt,
+                    system=system,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+
+        return await asyncio.gather(*(_one(p) for p in prompts))
+
     async def chat(
         self,
         model: str,
@@ -234,9 +383,24 @@ class OllamaClient:
         Returns:
             OllamaResponse with generated content
         """
+        cache_key = self._response_cache_key(
+            "chat",
+            model,
+            orjson.dumps(messages).decode(),
+            f"{temperature:.2f}",
+            str(max_tokens),
+        )
+        cached = self._response_cache_get(cache_key)
+        if cached is not None:
+            logger.info("ollama_chat_cache_hit", model=model)
+            return cached
+
         try:
-            client = await self._get_client()
-            
+            system = next(
+                (m.get("content", "") for m in messages if m.get("role") == "system"), ""
+            )
+            client = await self._get_client(self._select_node(model, system))
+
             payload = {
                 "model": model,
                 "messages": messages,
@@ -248,8 +412,13 @@ class OllamaClient:
             }
             
             logger.info("ollama_chat_start", model=model, num_messages=len(messages))
-            
-            response = await client.post("/api/chat", json=payload)
+
+            started = time.monotonic()
+            response = await asyncio.wait_for(
+                client.post("/api/chat", json=payload),
+                timeout=self._latency.timeout_for(model, self.timeout),
+            )
+            self._latency.record(model, time.monotonic() - started)
             response.raise_for_status()
             data = response.json()
             
@@ -272,7 +441,8 @@ class OllamaClient:
                 tokens=result.total_tokens,
                 tokens_per_sec=round(result.tokens_per_second, 2)
             )
-            
+
+            self._response_cache_put(cache_key, result)
             return result
             
         except Exception as e:
@@ -294,8 +464,8 @@ class OllamaClient:
             String chunks as they are generated
         """
         try:
-            client = await self._get_client()
-            
+            client = await self._get_client(self._select_node(model, system or ""))
+
             payload = {
                 "model": model,
                 "prompt": prompt,
@@ -309,18 +479,28 @@ class OllamaClient:
             if system:
                 payload["system"] = system
             
-            async with client.stream("POST", "/api/generate", json=payload) as response:
+            # orjson-encoded body skips httpx's stdlib-json serialization;
+            # raw byte buffering skips aiter_lines()'s per-chunk str decode
+            async with client.stream(
+                "POST",
+                "/api/generate",
+                content=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+            ) as response:
                 response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            if "response" in data:
-                                yield data["response"]
-                            if data.get("done", False):
-                                break
-                        except json.JSONDecodeError:
+                buf = bytearray()
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    buf += chunk
+                    while (newline := buf.find(b"\n")) >= 0:
+                        line = bytes(buf[:newline])
+                        del buf[:newline + 1]
+                        if not line.strip():
                             continue
+                        data = orjson.loads(line)
+                        if "response" in data:
+                            yield data["response"]
+                        if data.get("done", False):
+                            return
                             
         except Exception as e:
             logger.error("ollama_stream_failed", model=model, error=str(e))
@@ -337,18 +517,37 @@ class OllamaClient:
 
 # Singleton instance
 _ollama_client: Optional[OllamaClient] = None
+_ollama_client_lock = threading.Lock()
 
 
 def get_ollama_client() -> OllamaClient:
     """Get the singleton Ollama client"""
     global _ollama_client
     if _ollama_client is None:
-        _ollama_client = OllamaClient()
+        # Double-checked lock: concurrent first callers must not each build
+        # a client (and with it a separate connection pool)
+        with _ollama_client_lock:
+            if _ollama_client is None:
+                _ollama_client = OllamaClient()
     return _ollama_client
 
 
-# Model name mappings (our names -> Ollama names)
-MODEL_MAPPING = {
+async def init_ollama_client() -> None:
+    """Create the singleton and warm its pool (app startup)."""
+    # health_check swallows connection errors, so startup proceeds even
+    # when no local Ollama server is running
+    await get_ollama_client().health_check()
+
+
+async def close_ollama_client() -> None:
+    """Close the singleton's pooled connections (app shutdown)."""
+    if _ollama_client is not None:
+        await _ollama_client.close()
+
+
+# Model name mappings (our names -> Ollama names); read-only view so the
+# table cannot be mutated at runtime
+MODEL_MAPPING = types.MappingProxyType({
     "qwen2.5-3b": "qwen2.5:3b",     # Fast for CPU
     "qwen2.5-7b": "qwen2.5:7b",     # Good balance
     "qwen2.5-14b": "qwen2.5:14b",   # High quality
@@ -356,9 +555,12 @@ MODEL_MAPPING = {
     "llama3.1-8b": "llama3.1:8b",   # Alternative
     "llama3.1-70b": "llama3.1:70b", # Best Llama (needs GPU)
     # Fallback to same name if not in mapping
-}
+})
+
+# Bound method lookup hoisted out of the per-request call
+_get_ollama_name = MODEL_MAPPING.get
 
 
 def get_ollama_model_name(model_id: str) -> str:
     """Convert our model ID to Ollama model name"""
-    return MODEL_MAPPING.get(model_id, model_id)
+    return _get_ollama_name(model_id, model_id)
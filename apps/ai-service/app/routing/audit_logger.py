@@ -4,16 +4,34 @@ Comprehensive logging for compliance and transparency.
 Logs all routing decisions without exposing sensitive content.
 """
 
-import json
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+
+import orjson
+
+import aiofiles
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, List
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
 import hashlib
+import threading
 
 from .trust_router import RoutingResult, RoutingDecision, ModelProvider
 
+# Conversion rate used for the INR figures shown on the dashboard
+_USD_TO_INR = 83
+
+
+def _hash16(value: str) -> str:
+    """64-bit content fingerprint as 16 hex chars.
+
+    blake2b with a truncated digest size computes only the bits we keep,
+    instead of a full SHA-256 digest hex-encoded and then sliced.
+    """
+    return hashlib.blake2b(value.encode(), digest_size=8).hexdigest()
+
 
 @dataclass
 class AuditEntry:
@@ -72,9 +90,22 @@ class AuditLogger:
         
         if enable_file_logging:
             self.log_dir.mkdir(parents=True, exist_ok=True)
-        
-        # In-memory stats for dashboard
-        self._stats = {
+
+        # Buffered async writer state (see log_async/flush)
+        self.flush_batch_size = 100
+        self._buffer: List[bytes] = []
+        self._fh = None
+        self._fh_date: Optional[str] = None
+
+        # Queue-based background writer (see start_background_writer)
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # In-memory stats for dashboard. Counter gives atomic-feeling
+        # accumulation semantics; the lock makes the multi-field update
+        # explicit rather than relying on the GIL serializing each +=
+        self._stats_lock = threading.Lock()
+        self._stats = Counter({
             "total_requests": 0,
             "local_requests": 0,
             "cloud_requests": 0,
@@ -82,7 +113,7 @@ class AuditLogger:
             "pii_protected_count": 0,
             "total_cost_usd": 0.0,
             "total_saved_usd": 0.0,
-        }
+        })
     
     def log(
         self,
@@ -93,16 +124,39 @@ class AuditLogger:
     ) -> AuditEntry:
         """
         Log a routing decision.
-        
+
         CRITICAL: Content is hashed, never stored in plain text.
         """
+        entry = self._build_entry(routing_result, content, session_id, user_id)
+        self._update_stats(routing_result)
+
+        # Write to file: hand off to the background writer when it is
+        # running so the caller never pays an open/write/close cycle;
+        # open-per-entry is kept only as the no-event-loop fallback
+        if self.enable_file_logging:
+            if self._queue is not None:
+                try:
+                    self._queue.put_nowait(self._serialize(entry))
+                except asyncio.QueueFull:
+                    self._write_to_file(entry)
+            else:
+                self._write_to_file(entry)
+
+        return entry
+
+    def _build_entry(
+        self,
+        routing_result: RoutingResult,
+        content: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> AuditEntry:
+        """Build an AuditEntry from a routing result (content is hashed only)"""
         # Create content hash (for verification without storing content)
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-        
+        content_hash = _hash16(content)
+
         # Create anonymized user hash if provided
-        user_id_hash = None
-        if user_id:
-            user_id_hash = hashlib.sha256(user_id.encode()).hexdigest()[:16]
+        user_id_hash = _hash16(user_id) if user_id else None
         
         entry = AuditEntry(
             audit_id=routing_result.audit_id,
@@ -123,50 +177,168 @@ class AuditLogger:
             session_id=session_id,
             user_id_hash=user_id_hash
         )
-        
-        # Update stats
-        self._stats["total_requests"] += 1
-        if routing_result.is_local:
-            self._stats["local_requests"] += 1
-        else:
-            self._stats["cloud_requests"] += 1
-        
-        if routing_result.privacy_scan.document_attached:
-            self._stats["documents_processed_locally"] += 1
-        
-        self._stats["pii_protected_count"] += len(routing_result.privacy_scan.pii_found)
-        self._stats["total_cost_usd"] += routing_result.estimated_cost
-        self._stats["total_saved_usd"] += routing_result.cost_saved_vs_cloud
-        
-        # Write to file
+
+        return entry
+
+    @staticmethod
+    def _serialize(entry: AuditEntry) -> bytes:
+        """Serialize an entry to a newline-terminated JSON line.
+
+        orjson on the instance __dict__ (all fields are scalars) skips both
+        asdict()'s recursive copy and stdlib json's str round-trip.
+        """
+        return orjson.dumps(entry.__dict__, option=orjson.OPT_APPEND_NEWLINE)
+
+    def _update_stats(self, routing_result: RoutingResult):
+        """Update in-memory dashboard stats for a logged routing result"""
+        with self._stats_lock:
+            self._stats["total_requests"] += 1
+            if routing_result.is_local:
+                self._stats["local_requests"] += 1
+            else:
+                self._stats["cloud_requests"] += 1
+
+            if routing_result.privacy_scan.document_attached:
+                self._stats["documents_processed_locally"] += 1
+
+            self._stats["pii_protected_count"] += len(routing_result.privacy_scan.pii_found)
+            self._stats["total_cost_usd"] += routing_result.estimated_cost
+            self._stats["total_saved_usd"] += routing_result.cost_saved_vs_cloud
+
+    async def log_async(
+        self,
+        routing_result: RoutingResult,
+        content: str,
+        session_id: Optional[str] = None,
+        user_id: Optional[str] = None
+    ) -> AuditEntry:
+        """
+        Buffered async variant of log().
+
+        Serialized entries accumulate in memory and are flushed through a
+        shared aiofiles handle every `flush_batch_size` records, so the
+        request path never pays per-call open/write/close syscalls.
+        """
+        entry = self._build_entry(routing_result, content, session_id, user_id)
+        self._update_stats(routing_result)
+
         if self.enable_file_logging:
-            self._write_to_file(entry)
-        
+            if self._queue is not None:
+                # Background writer running: hand off the serialized line.
+                # put() blocks when the queue is full, applying back-pressure
+                # instead of growing memory without bound.
+                await self._queue.put(self._serialize(entry))
+            else:
+                self._buffer.append(self._serialize(entry))
+                if len(self._buffer) >= self.flush_batch_size:
+                    await self.flush()
+
         return entry
-    
+
+    def start_background_writer(self, maxsize: int = 1024):
+        """
+        Start the single consumer task that drains queued entries and
+        writes them in batches. Call once at app startup.
+        """
+        if self._writer_task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=maxsize)
+        self._writer_task = asyncio.create_task(self._drain_queue())
+
+    async def stop_background_writer(self):
+        """Stop the consumer task and flush everything. Call at shutdown."""
+        if self._writer_task is None:
+            return
+        await self._queue.put(None)  # sentinel
+        await self._writer_task
+        self._writer_task = None
+        self._queue = None
+        await self.aclose()
+
+    async def _drain_queue(self, max_batch: int = 64, max_wait_s: float = 0.05):
+        """
+        Consumer loop: block for the first entry, then accumulate up to
+        `max_batch` records or `max_wait_s` seconds and flush them as a
+        single write.
+        """
+        while True:
+            line = await self._queue.get()
+            if line is None:
+                await self.flush()
+                return
+
+            self._buffer.append(line)
+            deadline = asyncio.get_event_loop().time() + max_wait_s
+            while len(self._buffer) < max_batch:
+                timeout = deadline - asyncio.get_event_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    line = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if line is None:
+                    await self.flush()
+                    return
+                self._buffer.append(line)
+
+            await self.flush()
+
+    async def flush(self):
+        """Flush buffered entries to the daily log file (call on shutdown)"""
+        if not self._buffer:
+            return
+
+        lines, self._buffer = self._buffer, []
+        fh = await self._get_file_handle()
+        await fh.write(b"".join(lines))
+        await fh.flush()
+
+    async def aclose(self):
+        """Flush remaining entries and close the shared file handle"""
+        await self.flush()
+        if self._fh is not None:
+            await self._fh.close()
+            self._fh = None
+            self._fh_date = None
+
+    async def _get_file_handle(self):
+        """Get the shared aiofiles handle for today's log file, rotating daily"""
+        date_str = datetime.now().strftime("%Y-%m-%d")
+        if self._fh is None or self._fh_date != date_str:
+            if self._fh is not None:
+                await self._fh.close()
+            self._fh = await aiofiles.open(
+                self.log_dir / f"audit_{date_str}.jsonl", "ab"
+            )
+            self._fh_date = date_str
+        return self._fh
+
     def _write_to_file(self, entry: AuditEntry):
         """Write entry to daily log file"""
         date_str = datetime.now().strftime("%Y-%m-%d")
         log_file = self.log_dir / f"audit_{date_str}.jsonl"
         
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(entry)) + "\n")
+        with open(log_file, "ab") as f:
+            f.write(self._serialize(entry))
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics for dashboard"""
-        total = self._stats["total_requests"]
-        
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total = stats["total_requests"]
+
         return {
-            **self._stats,
+            **stats,
             "local_percentage": (
-                (self._stats["local_requests"] / total * 100)
+                (stats["local_requests"] / total * 100)
                 if total > 0 else 0
             ),
             "avg_cost_per_request_usd": (
-                self._stats["total_cost_usd"] / total
+                stats["total_cost_usd"] / total
                 if total > 0 else 0
             ),
-            "total_saved_inr": self._stats["total_saved_usd"] * 83,  # USD to INR
+            "total_saved_inr": stats["total_saved_usd"] * _USD_TO_INR,
         }
     
     def generate_compliance_report(
@@ -178,47 +350,73 @@ class AuditLogger:
         Generate compliance report for legal team.
         Shows data handling without exposing content.
         """
-        entries = self._load_entries(start_date, end_date)
-        
-        local_count = sum(1 for e in entries if e["is_local"])
-        cloud_count = len(entries) - local_count
-        
+        # Fold every statistic into one pass: the old version walked the
+        # entry list nine times, and for multi-month reports this loop is
+        # memory-bandwidth bound
+        total = 0
+        local_count = 0
+        docs_count = 0
+        pii_sum = 0
+        cost_sum = 0.0
+        saved_sum = 0.0
+        all_documents_local = True
+        all_pii_local = True
+        cloud_sensitive = 0
+        models = Counter()
+        sensitivities = Counter()
+
+        for e in self._load_entries(start_date, end_date):
+            total += 1
+            is_local = e["is_local"]
+            has_doc = e["document_attached"]
+            pii_count = e["pii_detected_count"]
+            sensitivity = e.get("sensitivity_level", "unknown")
+
+            if is_local:
+                local_count += 1
+            if has_doc:
+                docs_count += 1
+                if not is_local:
+                    all_documents_local = False
+            if pii_count:
+                pii_sum += pii_count
+                if not is_local:
+                    all_pii_local = False
+            if not is_local and (
+                has_doc or pii_count > 0 or sensitivity in ("confidential", "secret")
+            ):
+                cloud_sensitive += 1
+
+            cost_sum += e["estimated_cost_usd"]
+            saved_sum += e["cost_saved_usd"]
+            models[e.get("model_used", "unknown")] += 1
+            sensitivities[sensitivity] += 1
+
         return {
             "report_period": {
                 "start": start_date.isoformat(),
                 "end": end_date.isoformat()
             },
             "summary": {
-                "total_requests": len(entries),
+                "total_requests": total,
                 "processed_locally": local_count,
-                "processed_cloud": cloud_count,
-                "local_percentage": (local_count / len(entries) * 100) if entries else 0,
-                "documents_processed": sum(1 for e in entries if e["document_attached"]),
-                "pii_instances_protected": sum(e["pii_detected_count"] for e in entries),
+                "processed_cloud": total - local_count,
+                "local_percentage": (local_count / total * 100) if total else 0,
+                "documents_processed": docs_count,
+                "pii_instances_protected": pii_sum,
             },
             "privacy_compliance": {
-                "all_documents_local": all(
-                    e["is_local"] for e in entries if e["document_attached"]
-                ),
-                "all_pii_local": all(
-                    e["is_local"] for e in entries if e["pii_detected_count"] > 0
-                ),
-                "sensitive_data_cloud_exposure": sum(
-                    1 for e in entries 
-                    if not e["is_local"] and (
-                        e["document_attached"] or 
-                        e["pii_detected_count"] > 0 or
-                        e["sensitivity_level"] in ["confidential", "secret"]
-                    )
-                ),
+                "all_documents_local": all_documents_local,
+                "all_pii_local": all_pii_local,
+                "sensitive_data_cloud_exposure": cloud_sensitive,
             },
             "cost_analysis": {
-                "total_cost_usd": sum(e["estimated_cost_usd"] for e in entries),
-                "total_saved_usd": sum(e["cost_saved_usd"] for e in entries),
-                "total_saved_inr": sum(e["cost_saved_usd"] for e in entries) * 83,
+                "total_cost_usd": cost_sum,
+                "total_saved_usd": saved_sum,
+                "total_saved_inr": saved_sum * _USD_TO_INR,
             },
-            "models_used": self._count_by_field(entries, "model_used"),
-            "sensitivity_distribution": self._count_by_field(entries, "sensitivity_level"),
+            "models_used": dict(models),
+            "sensitivity_distribution": dict(sensitivities),
             "generated_at": datetime.now().isoformat()
         }
     
@@ -226,36 +424,24 @@ class AuditLogger:
         self,
         start_date: datetime,
         end_date: datetime
-    ) -> List[Dict[str, Any]]:
-        """Load entries from log files within date range"""
-        entries = []
-        current = start_date
-        
-        while current <= end_date:
-            date_str = current.strftime("%Y-%m-%d")
-            log_file = self.log_dir / f"audit_{date_str}.jsonl"
-            
-            if log_file.exists():
-                with open(log_file, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.strip():
-                            entries.append(json.loads(line))
-            
-            current += timedelta(days=1)
-        
-        return entries
-    
-    def _count_by_field(
-        self,
-        entries: List[Dict[str, Any]],
-        field: str
-    ) -> Dict[str, int]:
-        """Count entries by a specific field"""
-        counts = {}
-        for entry in entries:
-            value = entry.get(field, "unknown")
-            counts[value] = counts.get(value, 0) + 1
-        return counts
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream entries from log files within the date range.
+
+        Yields one parsed entry at a time so multi-month reports never
+        materialize the whole log in memory; the date filter is a string
+        compare on the filename (ISO dates sort lexicographically).
+        """
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+
+        for path in sorted(self.log_dir.glob("audit_*.jsonl")):
+            day = path.stem[6:]  # strip the "audit_" prefix
+            if not start_str <= day <= end_str:
+                continue
+            with open(path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
     
     def get_trust_dashboard_data(self) -> Dict[str, Any]:
         """
@@ -273,7 +459,7 @@ class AuditLogger:
             },
             "cost_metrics": {
                 "total_saved_inr": f"₹{stats['total_saved_inr']:.2f}",
-                "avg_cost_per_query": f"₹{stats['avg_cost_per_request_usd'] * 83:.4f}",
+                "avg_cost_per_query": f"₹{stats['avg_cost_per_request_usd'] * _USD_TO_INR:.4f}",
             },
             "guarantees": [
                 "All uploaded documents processed on-premise",
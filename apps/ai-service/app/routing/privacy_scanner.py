@@ -4,11 +4,36 @@ Detects sensitive content in documents and queries to ensure
 confidential data NEVER leaves the local environment.
 """
 
+import bisect
+import hashlib
+import itertools
+import os
 import re
+import sys
 from enum import Enum
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    import re2 as _re2  # google-re2: guaranteed linear-time matching
+except ImportError:
+    _re2 = None
+
+
+def _compile_linear(pattern: str, flags: int = re.IGNORECASE):
+    """Compile with re2 when installed, falling back to stdlib ``re``.
+
+    The PII and case-identifier patterns run over untrusted document
+    text; re2's DFA engine bounds their cost at O(n) where the stdlib
+    backtracking engine can degrade on adversarial digit runs.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except _re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 
 class SensitivityLevel(Enum):
     """Data classification levels following legal industry standards"""
@@ -18,18 +43,113 @@ class SensitivityLevel(Enum):
     SECRET = "secret"           # LOCAL ONLY - privileged communications
 
 
-@dataclass
+# The hot path tracks the level as a plain int (one PyLong compare per
+# escalation, no enum hashing) and converts to the member once at the
+# end via this tuple
+_LEVELS = tuple(SensitivityLevel)
+_PUBLIC, _INTERNAL, _CONFIDENTIAL, _SECRET = range(4)
+
+
+def _luhn_valid(number: str) -> bool:
+    """Luhn checksum over the digits of a candidate card number.
+
+    The credit-card regex fires on any 16-digit run, so timestamps and
+    order numbers would otherwise escalate to CONFIDENTIAL; only ~10%
+    of random digit runs pass the checksum.
+    """
+    total = 0
+    digits = [int(ch) for ch in number if ch.isdigit()]
+    for i, digit in enumerate(reversed(digits)):
+        if i % 2:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return total % 10 == 0
+
+
+def _compile_pii(patterns: Dict[str, str]) -> Dict[str, object]:
+    return {name: _compile_linear(p) for name, p in patterns.items()}
+
+
+def _compile_redaction_union(patterns: Dict[str, str]):
+    return re.compile(
+        "|".join(f"(?P<{name}>{p})" for name, p in patterns.items()),
+        re.IGNORECASE,
+    )
+
+
+def _compile_case_union(patterns: List[str]):
+    return _compile_linear("|".join(f"(?:{p})" for p in patterns))
+
+
+def _trie_pattern(words) -> str:
+    """Render literal strings as a trie-shaped regex.
+
+    A flat alternation re-compares each marker's full text at every
+    position; sharing common prefixes in a trie lets the engine reject
+    most positions after a couple of character tests. The optional
+    suffix groups are greedy, so the longest marker still wins
+    overlapping matches.
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: Dict) -> str:
+        if "" in node and len(node) == 1:
+            return ""
+        alternatives = [
+            re.escape(ch) + render(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        terminal = "" in node
+        if len(alternatives) == 1 and not terminal:
+            return alternatives[0]
+        rendered = "(?:" + "|".join(alternatives) + ")"
+        return rendered + "?" if terminal else rendered
+
+    return render(trie)
+
+
+def _compile_marker_union(markers_by_category: Dict[str, List[str]]):
+    # Keys are casefolded (not lower(): correct for non-ASCII document
+    # text) and interned so the per-match dict/set probes hit the
+    # short-string identity fast path
+    marker_map: Dict[str, List[str]] = {}
+    for category, markers in markers_by_category.items():
+        for marker in markers:
+            marker_map.setdefault(sys.intern(marker.casefold()), []).append(category)
+    union = re.compile(_trie_pattern(marker_map), re.IGNORECASE)
+    return marker_map, union
+
+
+@dataclass(slots=True)
 class ScanResult:
-    """Result of privacy scan"""
+    """Result of privacy scan.
+
+    legal_markers holds raw (label, marker) pairs; the routing path only
+    needs their count, so the display strings are built on demand via
+    legal_markers_formatted instead of allocating one per hit.
+    """
     sensitivity_level: SensitivityLevel
     detected_patterns: List[str]
     pii_found: List[str]
-    legal_markers: List[str]
+    legal_markers: List[Tuple[str, str]]
     document_attached: bool
     confidence_score: float
     recommendation: str
     force_local: bool
 
+    @property
+    def legal_markers_formatted(self) -> List[str]:
+        """Human-readable marker strings for audit/display output."""
+        return [f"{label}: {marker}" for label, marker in self.legal_markers]
+
 
 class PrivacyScanner:
     """
@@ -56,6 +176,32 @@ class PrivacyScanner:
         "person_name_context": r'\b(?:Mr\.|Mrs\.|Ms\.|Dr\.|Shri|Smt\.|Adv\.)\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',
     }
     
+    # Cheap character-class gates per PII pattern: one C-level pass per
+    # distinct gate decides whether the text can contain a character the
+    # pattern requires; on a miss the full regex is skipped. Only
+    # characters the pattern REQUIRES are gated (separators like "-" are
+    # optional in ssn/credit_card, so a digit is the only safe gate
+    # there); None means always run.
+    _DIGIT_GATE = re.compile(r"[0-9]")
+    _AT_GATE = re.compile("@")
+    _DOT_GATE = re.compile(r"\.")
+    # PAN and GSTIN share a rigid five-letters-then-four-digits core, so
+    # their gate demands the full structural window rather than just any
+    # digit — digit-bearing prose without that shape skips both regexes
+    _PAN_CORE_GATE = re.compile(r"[A-Za-z]{5}[0-9]{4}")
+    PII_PREFILTER = {
+        "aadhaar": _DIGIT_GATE,
+        "pan": _PAN_CORE_GATE,
+        "indian_phone": _DIGIT_GATE,
+        "indian_passport": _DIGIT_GATE,
+        "gstin": _PAN_CORE_GATE,
+        "ssn": _DIGIT_GATE,
+        "email": _AT_GATE,
+        "credit_card": _DIGIT_GATE,
+        "ip_address": _DOT_GATE,
+        "person_name_context": None,
+    }
+
     # Legal sensitivity markers
     LEGAL_SENSITIVITY_MARKERS = {
         "privileged": [
@@ -130,25 +276,116 @@ class PrivacyScanner:
     }
     
     # File extensions that always require local processing
-    SENSITIVE_FILE_TYPES = {
+    SENSITIVE_FILE_TYPES = frozenset({
         ".pdf", ".doc", ".docx", ".xls", ".xlsx",
         ".ppt", ".pptx", ".odt", ".rtf", ".txt"
+    })
+
+    # Literal-marker categories folded into one multi-pattern scan.
+    # Each maps to (marker label, minimum level rank, forces local
+    # routing); ranks index into _LEVELS.
+    MARKER_CATEGORIES = {
+        "privileged": ("privileged", _SECRET, True),
+        "confidential": ("confidential", _CONFIDENTIAL, True),
+        "client_data": ("client_data", _CONFIDENTIAL, True),
+        "financial": ("financial", _CONFIDENTIAL, True),
+        "document_types": ("document_type", _INTERNAL, False),
     }
-    
-    def __init__(self):
+
+    # scan() is deterministic in its inputs, and chat UIs re-scan the
+    # same query on retries and re-renders; a bounded memo turns those
+    # repeats into a dict probe
+    SCAN_CACHE_MAX = 1024
+
+    # File extracts above the threshold are scanned in overlapping
+    # chunks instead of as one concatenated buffer; the overlap exceeds
+    # any marker/case pattern span so boundary hits are still found
+    STREAM_THRESHOLD = 256 * 1024
+    STREAM_CHUNK = 1 << 20
+    STREAM_OVERLAP = 64
+
+    def __init__(
+        self,
+        enabled_pii: Optional[Set[str]] = None,
+        enabled_categories: Optional[Set[str]] = None,
+    ):
+        """
+        Args:
+            enabled_pii: Restrict PII detection to these PII_PATTERNS
+                keys (e.g. an Indian-law tenant dropping "ssn"); None
+                enables everything and shares the precompiled patterns
+            enabled_categories: Restrict marker detection to these
+                LEGAL_SENSITIVITY_MARKERS keys ("case_identifiers"
+                included); None enables everything
+        """
+        self._enabled_pii = enabled_pii
+        self._enabled_categories = enabled_categories
         self._compile_patterns()
-    
+        self._scan_cache: Dict[bytes, ScanResult] = {}
+
+    def _iter_segments(self, content: str, file_content: Optional[str]):
+        """Yield (segment, overlap_len) pieces of the text to scan.
+
+        Small inputs come out as one or two whole pieces; a large file
+        extract streams through in STREAM_CHUNK slices that carry
+        STREAM_OVERLAP chars of the previous slice so matches near a
+        boundary are not lost. overlap_len marks how much of the
+        segment's head was already scanned, letting callers skip
+        re-counting matches that end inside it.
+        """
+        yield content, 0
+        if not file_content:
+            return
+        if len(file_content) <= self.STREAM_THRESHOLD:
+            yield " " + file_content, 0
+            return
+        step = self.STREAM_CHUNK
+        for start in range(0, len(file_content), step):
+            overlap = self.STREAM_OVERLAP if start else 0
+            yield file_content[start - overlap:start + step], overlap
+
     def _compile_patterns(self):
-        """Pre-compile regex patterns for performance"""
-        self._pii_compiled = {
-            name: re.compile(pattern, re.IGNORECASE)
-            for name, pattern in self.PII_PATTERNS.items()
-        }
-        
-        self._case_patterns = [
-            re.compile(pattern, re.IGNORECASE)
-            for pattern in self.LEGAL_SENSITIVITY_MARKERS["case_identifiers"]
-        ]
+        """Bind the shared compiled patterns (built once at import).
+
+        A single-tenant deployment that disables categories gets a
+        restricted compile instead: disabled patterns then cost nothing
+        per scan rather than matching and being filtered.
+        """
+        if self._enabled_pii is None:
+            self._pii_compiled = _PII_COMPILED
+            self._redaction_union = _REDACTION_UNION
+        else:
+            subset = {
+                name: pattern
+                for name, pattern in self.PII_PATTERNS.items()
+                if name in self._enabled_pii
+            }
+            self._pii_compiled = _compile_pii(subset)
+            # An empty union would compile to "" and match everywhere
+            # with lastgroup=None, so an empty subset disables the union
+            self._redaction_union = _compile_redaction_union(subset) if subset else None
+
+        if self._enabled_categories is None:
+            self._case_union = _CASE_UNION
+            self._marker_map = _MARKER_MAP
+            self._marker_union = _MARKER_UNION
+        else:
+            self._case_union = (
+                _CASE_UNION
+                if "case_identifiers" in self._enabled_categories
+                else None
+            )
+            marker_subset = {
+                category: self.LEGAL_SENSITIVITY_MARKERS[category]
+                for category in self.MARKER_CATEGORIES
+                if category in self._enabled_categories
+            }
+            if marker_subset:
+                self._marker_map, self._marker_union = _compile_marker_union(
+                    marker_subset
+                )
+            else:
+                self._marker_map, self._marker_union = {}, None
     
     def scan(
         self,
@@ -156,122 +393,159 @@ class PrivacyScanner:
         file_attached: bool = False,
         file_name: Optional[str] = None,
         file_content: Optional[str] = None,
-        metadata: Optional[Dict] = None
+        metadata: Optional[Dict] = None,
+        fast_path: bool = True,
     ) -> ScanResult:
         """
         Comprehensive scan for sensitive content.
-        
+
         Args:
             content: The query/message text
             file_attached: Whether a file is attached
             file_name: Name of attached file
             file_content: Content of attached file (if extracted)
             metadata: Additional context
-            
+            fast_path: Return as soon as SECRET is reached (the routing
+                decision cannot change past that point); pass False to
+                collect the full marker inventory for audit reports
+
         Returns:
             ScanResult with sensitivity level and detected patterns
         """
+        cache_key = hashlib.blake2b(
+            "\x00".join(
+                (content, file_content or "", file_name or "",
+                 str(file_attached), str(fast_path))
+            ).encode(),
+            digest_size=16,
+        ).digest()
+        cached = self._scan_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         detected_patterns = []
         pii_found = []
         legal_markers = []
-        sensitivity_level = SensitivityLevel.PUBLIC
+        level = _PUBLIC
         force_local = False
-        
-        # Combine all text to scan
-        full_text = content
-        if file_content:
-            full_text += " " + file_content
-        
-        full_text_lower = full_text.lower()
-        
-        # RULE 1: Any file attachment = CONFIDENTIAL minimum
+
+        # RULE 1: Document-type attachments = CONFIDENTIAL. Attachments
+        # whose extension is known NOT to carry documents (e.g. images)
+        # stay INTERNAL; an unknown name is treated conservatively.
         if file_attached:
-            sensitivity_level = SensitivityLevel.CONFIDENTIAL
             detected_patterns.append("document_attached")
-            force_local = True
-        
-        # RULE 2: Check for PII
-        for pii_name, pattern in self._pii_compiled.items():
-            matches = pattern.findall(full_text)
-            if matches:
-                pii_found.extend([f"{pii_name}: {m[:4]}***" for m in matches[:3]])
-                sensitivity_level = max(
-                    sensitivity_level,
-                    SensitivityLevel.CONFIDENTIAL,
-                    key=lambda x: list(SensitivityLevel).index(x)
-                )
+            ext = os.path.splitext(file_name)[1].lower() if file_name else ""
+            if not ext or ext in self.SENSITIVE_FILE_TYPES:
+                level = _CONFIDENTIAL
                 force_local = True
-        
-        # RULE 3: Check for privileged communication markers
-        for marker in self.LEGAL_SENSITIVITY_MARKERS["privileged"]:
-            if marker in full_text_lower:
-                legal_markers.append(f"privileged: {marker}")
-                sensitivity_level = SensitivityLevel.SECRET
-                force_local = True
-        
-        # RULE 4: Check for confidential markers
-        for marker in self.LEGAL_SENSITIVITY_MARKERS["confidential"]:
-            if marker in full_text_lower:
-                legal_markers.append(f"confidential: {marker}")
-                sensitivity_level = max(
-                    sensitivity_level,
-                    SensitivityLevel.CONFIDENTIAL,
-                    key=lambda x: list(SensitivityLevel).index(x)
-                )
-                force_local = True
-        
-        # RULE 5: Check for client/case data
-        for marker in self.LEGAL_SENSITIVITY_MARKERS["client_data"]:
-            if marker in full_text_lower:
-                legal_markers.append(f"client_data: {marker}")
-                sensitivity_level = max(
-                    sensitivity_level,
-                    SensitivityLevel.CONFIDENTIAL,
-                    key=lambda x: list(SensitivityLevel).index(x)
-                )
-                force_local = True
-        
-        # RULE 6: Check for case identifiers
-        for pattern in self._case_patterns:
-            if pattern.search(full_text):
-                legal_markers.append("case_identifier_detected")
-                force_local = True
-        
-        # RULE 7: Check for document type mentions
-        for doc_type in self.LEGAL_SENSITIVITY_MARKERS["document_types"]:
-            if doc_type in full_text_lower:
-                legal_markers.append(f"document_type: {doc_type}")
-                sensitivity_level = max(
-                    sensitivity_level,
-                    SensitivityLevel.INTERNAL,
-                    key=lambda x: list(SensitivityLevel).index(x)
-                )
-        
-        # RULE 8: Financial data check
-        for marker in self.LEGAL_SENSITIVITY_MARKERS["financial"]:
-            if marker in full_text_lower:
-                legal_markers.append(f"financial: {marker}")
-                sensitivity_level = max(
-                    sensitivity_level,
-                    SensitivityLevel.CONFIDENTIAL,
-                    key=lambda x: list(SensitivityLevel).index(x)
+            else:
+                level = _INTERNAL
+
+        # RULES 2-8 run over bounded segments: small inputs are a single
+        # piece (identical to scanning one concatenated buffer), while a
+        # large file extract streams through in chunks so peak memory
+        # stays O(chunk) instead of O(file).
+        pii_hits: Dict[str, List[str]] = {name: [] for name in self._pii_compiled}
+        seen_markers = set()
+        secret_exit = False
+        case_found = False
+
+        for segment, overlap in self._iter_segments(content, file_content):
+            # RULE 2: Check for PII. Character-class gates skip a
+            # pattern's regex when the segment lacks a character it
+            # requires; each distinct gate (the digit class is shared by
+            # eight patterns) runs once per segment. Matches that end
+            # inside the overlap were already counted in the previous
+            # segment. Only the first three hits per pattern are
+            # reported, so the engine stops there instead of
+            # materializing every match in the document.
+            gate_hits = {}
+            for pii_name, pattern in self._pii_compiled.items():
+                hits = pii_hits[pii_name]
+                if len(hits) >= 3:
+                    continue
+                gate = self.PII_PREFILTER.get(pii_name)
+                if gate is not None:
+                    hit = gate_hits.get(gate)
+                    if hit is None:
+                        hit = gate.search(segment) is not None
+                        gate_hits[gate] = hit
+                    if not hit:
+                        continue
+                fresh = (
+                    m.group()
+                    for m in pattern.finditer(segment)
+                    if m.end() > overlap
                 )
+                if pii_name == "credit_card":
+                    fresh = (g for g in fresh if _luhn_valid(g))
+                hits.extend(itertools.islice(fresh, 3 - len(hits)))
+
+            # RULES 3-5, 7-8: one pass over the segment finds every
+            # literal marker (privileged / confidential / client_data /
+            # financial / document_types); the category lookup then
+            # applies the level bump and routing decision per marker
+            marker_matches = (
+                self._marker_union.finditer(segment)
+                if self._marker_union is not None else ()
+            )
+            for match in marker_matches:
+                marker = match.group().casefold()
+                if marker in seen_markers:
+                    continue
+                seen_markers.add(marker)
+                for category in self._marker_map[marker]:
+                    label, category_level, marks_local = self.MARKER_CATEGORIES[category]
+                    legal_markers.append((label, marker))
+                    if category_level > level:
+                        level = category_level
+                    if marks_local:
+                        force_local = True
+                # SECRET + force_local cannot escalate further; the
+                # routing decision is settled, so skip the rest
+                if fast_path and level == _SECRET:
+                    secret_exit = True
+                    break
+            if secret_exit:
+                break
+
+            # RULE 6: Check for case identifiers
+            if (
+                not case_found
+                and self._case_union is not None
+                and self._case_union.search(segment)
+            ):
+                case_found = True
+
+        for pii_name in self._pii_compiled:
+            hits = pii_hits[pii_name]
+            if hits:
+                pii_found.extend(f"{pii_name}: {m[:4]}***" for m in hits)
+                if level < _CONFIDENTIAL:
+                    level = _CONFIDENTIAL
                 force_local = True
-        
-        # Calculate confidence score
-        total_markers = len(pii_found) + len(legal_markers) + len(detected_patterns)
-        confidence_score = min(1.0, total_markers * 0.2 + (0.5 if file_attached else 0))
+
+        if case_found:
+            legal_markers.append(("case_identifier", "detected"))
+            force_local = True
+
+        # Calculate confidence score (a privileged hit is conclusive)
+        if secret_exit:
+            confidence_score = 1.0
+        else:
+            total_markers = len(pii_found) + len(legal_markers) + len(detected_patterns)
+            confidence_score = min(1.0, total_markers * 0.2 + (0.5 if file_attached else 0))
         
         # Generate recommendation
         if force_local:
             recommendation = "LOCAL_ONLY: Sensitive content detected. Processing on-premise."
-        elif sensitivity_level == SensitivityLevel.INTERNAL:
+        elif level == _INTERNAL:
             recommendation = "LOCAL_PREFERRED: Some legal context detected. Local recommended."
         else:
             recommendation = "CLOUD_OK: No sensitive content detected. Cloud processing allowed."
-        
-        return ScanResult(
-            sensitivity_level=sensitivity_level,
+
+        result = ScanResult(
+            sensitivity_level=_LEVELS[level],
             detected_patterns=detected_patterns,
             pii_found=pii_found,
             legal_markers=legal_markers,
@@ -280,19 +554,177 @@ class PrivacyScanner:
             recommendation=recommendation,
             force_local=force_local
         )
+        if len(self._scan_cache) >= self.SCAN_CACHE_MAX:
+            self._scan_cache.pop(next(iter(self._scan_cache)))
+        self._scan_cache[cache_key] = result
+        return result
     
+    def scan_batch(self, contents: List[str]) -> List[ScanResult]:
+        """
+        Scan many inputs in one pass per pattern family.
+
+        The inputs are joined with a NUL sentinel and each union regex
+        runs once over the combined buffer; matches are assigned back
+        to their input by a binary search over the start offsets. NUL
+        is not whitespace and appears in no pattern's character class,
+        so no match can traverse it (\\x1f would not do: \\s matches
+        it); as a second line of defense, any match spanning an input
+        boundary is discarded rather than attributed to either side.
+        Amortizes regex setup across the batch — worthwhile when the
+        batch is large and the individual texts are short.
+        """
+        if not contents:
+            return []
+
+        buf = "\x00".join(contents)
+        starts = []
+        pos = 0
+        for text in contents:
+            starts.append(pos)
+            pos += len(text) + 1
+
+        def owner(offset: int) -> int:
+            return bisect.bisect_right(starts, offset) - 1
+
+        n = len(contents)
+        pii_hits: List[Dict[str, List[str]]] = [{} for _ in range(n)]
+        marker_hits: List[List[str]] = [[] for _ in range(n)]
+        seen_markers: List[set] = [set() for _ in range(n)]
+        case_hit = [False] * n
+
+        # The redaction union already carries every PII pattern as a
+        # named group, so one pass covers all ten. A match crossing an
+        # input boundary would be a stitched-together false positive,
+        # so it is dropped (the NUL sentinel should already prevent it).
+        if self._redaction_union is not None:
+            for match in self._redaction_union.finditer(buf):
+                idx = owner(match.start())
+                if owner(match.end() - 1) != idx:
+                    continue
+                if match.lastgroup == "credit_card" and not _luhn_valid(match.group()):
+                    continue
+                hits = pii_hits[idx].setdefault(match.lastgroup, [])
+                if len(hits) < 3:
+                    hits.append(match.group())
+
+        if self._marker_union is not None:
+            for match in self._marker_union.finditer(buf):
+                idx = owner(match.start())
+                marker = match.group().casefold()
+                if marker not in seen_markers[idx]:
+                    seen_markers[idx].add(marker)
+                    marker_hits[idx].append(marker)
+
+        if self._case_union is not None:
+            for match in self._case_union.finditer(buf):
+                # same boundary defense as the PII pass
+                if owner(match.start()) == owner(match.end() - 1):
+                    case_hit[owner(match.start())] = True
+
+        results = []
+        for idx in range(n):
+            level = _PUBLIC
+            force_local = False
+            pii_found = []
+            legal_markers = []
+
+            for pii_name, hits in pii_hits[idx].items():
+                pii_found.extend(f"{pii_name}: {h[:4]}***" for h in hits)
+                if level < _CONFIDENTIAL:
+                    level = _CONFIDENTIAL
+                force_local = True
+
+            for marker in marker_hits[idx]:
+                for category in self._marker_map[marker]:
+                    label, category_level, marks_local = self.MARKER_CATEGORIES[category]
+                    legal_markers.append((label, marker))
+                    if category_level > level:
+                        level = category_level
+                    if marks_local:
+                        force_local = True
+
+            if case_hit[idx]:
+                legal_markers.append(("case_identifier", "detected"))
+                force_local = True
+
+            total_markers = len(pii_found) + len(legal_markers)
+            confidence_score = min(1.0, total_markers * 0.2)
+
+            if force_local:
+                recommendation = "LOCAL_ONLY: Sensitive content detected. Processing on-premise."
+            elif level == _INTERNAL:
+                recommendation = "LOCAL_PREFERRED: Some legal context detected. Local recommended."
+            else:
+                recommendation = "CLOUD_OK: No sensitive content detected. Cloud processing allowed."
+
+            results.append(ScanResult(
+                sensitivity_level=_LEVELS[level],
+                detected_patterns=[],
+                pii_found=pii_found,
+                legal_markers=legal_markers,
+                document_attached=False,
+                confidence_score=confidence_score,
+                recommendation=recommendation,
+                force_local=force_local
+            ))
+
+        return results
+
     def get_redacted_version(self, content: str) -> Tuple[str, List[str]]:
         """
         Create a redacted version of content for logging.
         Useful for audit trails without exposing PII.
         """
-        redacted = content
         redactions = []
-        
-        for pii_name, pattern in self._pii_compiled.items():
-            matches = pattern.findall(content)
-            for match in matches:
-                redacted = redacted.replace(match, f"[REDACTED-{pii_name.upper()}]")
-                redactions.append(f"{pii_name}: {match[:4]}***")
-        
-        return redacted, redactions
+        if self._redaction_union is None:
+            return content, redactions
+
+        def _redact(match: re.Match) -> str:
+            name = match.lastgroup
+            redactions.append(f"{name}: {match.group()[:4]}***")
+            return f"[REDACTED-{name.upper()}]"
+
+        return self._redaction_union.sub(_redact, content), redactions
+
+
+# Shared compiled state, built once at import: every call site that
+# constructed its own PrivacyScanner() previously recompiled all ~25
+# patterns. The union builders are kept as functions so a scanner could
+# compile a restricted set if it ever needs to.
+#
+# _PII_COMPILED: per-pattern compiled regexes (linear-time engine when
+# available). _REDACTION_UNION doubles as the batch PII union; the
+# marker union resolves literal markers to categories via _MARKER_MAP.
+_PII_COMPILED = _compile_pii(PrivacyScanner.PII_PATTERNS)
+_REDACTION_UNION = _compile_redaction_union(PrivacyScanner.PII_PATTERNS)
+_CASE_UNION = _compile_case_union(
+    PrivacyScanner.LEGAL_SENSITIVITY_MARKERS["case_identifiers"]
+)
+_MARKER_MAP, _MARKER_UNION = _compile_marker_union({
+    category: PrivacyScanner.LEGAL_SENSITIVITY_MARKERS[category]
+    for category in PrivacyScanner.MARKER_CATEGORIES
+})
+
+
+# Process-wide default scanner; its scan cache is shared across call
+# sites that do not need their own instance
+DEFAULT_SCANNER = PrivacyScanner()
+
+
+def scan(
+    content: str,
+    file_attached: bool = False,
+    file_name: Optional[str] = None,
+    file_content: Optional[str] = None,
+    metadata: Optional[Dict] = None,
+    fast_path: bool = True,
+) -> ScanResult:
+    """Scan with the process-wide default scanner."""
+    return DEFAULT_SCANNER.scan(
+        content,
+        file_attached=file_attached,
+        file_name=file_name,
+        file_content=file_content,
+        metadata=metadata,
+        fast_path=fast_path,
+    )
@@ -4,7 +4,9 @@ Privacy-first routing with transparency for legal applications.
 Ensures sensitive data NEVER leaves local environment.
 """
 
+import functools
 import os
+import re
 import time
 from enum import Enum
 from typing import Optional, Dict, Any, List
@@ -48,7 +50,7 @@ class ModelConfig:
     priority: int = 1  # Lower = higher priority
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingResult:
     """Complete routing decision with transparency info"""
     decision: RoutingDecision
@@ -275,6 +277,17 @@ class TrustRouter:
         use_groq_fallback: bool = True,  # Use Groq when Ollama unavailable
     ):
         self.privacy_scanner = PrivacyScanner()
+        # One compiled union per keyword tier: complexity analysis then
+        # costs at most two C-level scans instead of ~25 substring
+        # passes over a lowercased copy of the query
+        self._complex_union = re.compile(
+            "|".join(re.escape(k) for k in self.COMPLEX_TASK_KEYWORDS),
+            re.IGNORECASE,
+        )
+        self._simple_union = re.compile(
+            "|".join(re.escape(k) for k in self.SIMPLE_TASK_KEYWORDS),
+            re.IGNORECASE,
+        )
         self.enable_cloud = enable_cloud
         self.default_local_model = default_local_model
         self.default_cloud_model = default_cloud_model
@@ -282,6 +295,15 @@ class TrustRouter:
         self.prefer_local = prefer_local
         self.use_groq_fallback = use_groq_fallback and bool(GROQ_API_KEY)
         self._request_counter = 0
+        # Specialize the routing function once: the config flags are fixed
+        # for the router's lifetime, so bind them ahead of time instead of
+        # re-reading instance attributes on every request
+        self._specialized_route = functools.partial(
+            self._route_impl,
+            enable_cloud=self.enable_cloud,
+            cost_optimization=self.cost_optimization,
+            prefer_local=self.prefer_local,
+        )
     
     def analyze_complexity(self, content: str) -> str:
         """
@@ -292,20 +314,16 @@ class TrustRouter:
             'moderate' - Standard legal queries
             'complex' - Analysis, drafting, comprehensive research
         """
-        content_lower = content.lower()
-        word_count = len(content.split())
-        
-        # Check for complex task indicators
-        for keyword in self.COMPLEX_TASK_KEYWORDS:
-            if keyword in content_lower:
-                return "complex"
-        
+        # Check for complex task indicators (take priority over simple)
+        if self._complex_union.search(content):
+            return "complex"
+
         # Check for simple task indicators
-        for keyword in self.SIMPLE_TASK_KEYWORDS:
-            if keyword in content_lower:
-                return "simple"
-        
+        if self._simple_union.search(content):
+            return "simple"
+
         # Use length as a heuristic
+        word_count = len(content.split())
         if word_count > 100:
             return "complex"
         elif word_count < 20:
@@ -372,13 +390,13 @@ class TrustRouter:
     ) -> RoutingResult:
         """
         Route request to appropriate model with full transparency.
-        
+
         CRITICAL RULES:
         1. If file_attached = True → LOCAL ONLY
         2. If PII detected → LOCAL ONLY
         3. If legal sensitivity markers → LOCAL ONLY
         4. User can always force local
-        
+
         Args:
             content: The query text
             file_attached: Whether a document is attached
@@ -387,10 +405,35 @@ class TrustRouter:
             user_model_preference: User's explicit model choice
             force_local: User forced local processing
             estimated_tokens: Estimated token count for cost calculation
-            
+
         Returns:
             RoutingResult with full transparency information
         """
+        return self._specialized_route(
+            content,
+            file_attached=file_attached,
+            file_name=file_name,
+            file_content=file_content,
+            user_model_preference=user_model_preference,
+            force_local=force_local,
+            estimated_tokens=estimated_tokens,
+        )
+
+    def _route_impl(
+        self,
+        content: str,
+        file_attached: bool = False,
+        file_name: Optional[str] = None,
+        file_content: Optional[str] = None,
+        user_model_preference: Optional[str] = None,
+        force_local: bool = False,
+        estimated_tokens: int = 1000,
+        *,
+        enable_cloud: bool,
+        cost_optimization: bool,
+        prefer_local: bool,
+    ) -> RoutingResult:
+        """Routing implementation with config flags bound via functools.partial."""
         start_time = time.time()
         self._request_counter += 1
         audit_id = f"LR-{datetime.now().strftime('%Y%m%d%H%M%S')}-{self._request_counter:06d}"
@@ -440,16 +483,16 @@ class TrustRouter:
             if user_model_preference and user_model_preference in self.MODELS and not is_auto_mode:
                 # User explicitly chose a specific model
                 model = self.MODELS[user_model_preference]
-            elif self.prefer_local:
+            elif prefer_local:
                 # LOCAL-FIRST MODE: Try local for privacy + cost savings
                 # Only use cloud for complex queries that need more power
-                if complexity == "complex" and self.enable_cloud:
+                if complexity == "complex" and enable_cloud:
                     # Complex query: use cheapest capable cloud model
                     model = self.select_cloud_model(complexity)
                 else:
                     # Simple/moderate: local is sufficient and free
                     model = self.select_local_model(complexity)
-            elif self.cost_optimization:
+            elif cost_optimization:
                 # Cost-optimization mode: choose cheapest cloud model
                 model = self.select_cloud_model(complexity)
             else:
@@ -6,6 +6,7 @@ import uuid
 
 from sqlalchemy import Select, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.db_models import ChatMessage, ChatSession, Note, NoteHistory, SessionFile
 
@@ -17,7 +18,7 @@ async def ensure_session(session: AsyncSession, session_id: Optional[str], user_
         if existing:
             return session_id
 
-    new_id = session_id or str(uuid.uuid4())
+    new_id = session_id or uuid.uuid4().hex
     session.add(
         ChatSession(
             id=new_id,
@@ -58,6 +59,45 @@ async def append_message(
     await session.flush()
 
 
+async def append_messages(
+    session: AsyncSession,
+    session_id: str,
+    messages: Iterable[tuple[str, str, Optional[dict]]],
+) -> None:
+    """
+    Persist several chat messages as one batch.
+
+    Builds all ORM objects in memory and flushes once, so the inserts
+    pipeline as a single executemany and the session metadata is
+    updated once instead of per message.
+    """
+    now = datetime.utcnow()
+    msgs = [
+        ChatMessage(
+            session_id=session_id,
+            role=role,
+            content=content,
+            meta=metadata,
+            created_at=now,
+        )
+        for role, content, metadata in messages
+    ]
+    if not msgs:
+        return
+
+    session.add_all(msgs)
+    await session.execute(
+        update(ChatSession)
+        .where(ChatSession.id == session_id)
+        .values(
+            last_message_at=now,
+            last_message_preview=msgs[-1].content[:500],
+            updated_at=now,
+        )
+    )
+    await session.flush()
+
+
 async def list_sessions(session: AsyncSession, user_id: Optional[str]) -> list[dict]:
     stmt: Select = select(ChatSession).order_by(ChatSession.updated_at.desc()).limit(50)
     if user_id:
@@ -81,7 +121,9 @@ async def fetch_context(session: AsyncSession, session_id: str, limit_messages:
     messages_stmt = (
         select(ChatMessage)
         .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at.asc())
+        # id breaks created_at ties: batched appends stamp user and assistant
+        # rows with the same timestamp, and Postgres leaves ties unordered
+        .order_by(ChatMessage.created_at.asc(), ChatMessage.id.asc())
         .limit(limit_messages)
     )
     files_stmt = select(SessionFile).where(SessionFile.session_id == session_id).order_by(SessionFile.uploaded_at.desc())
@@ -170,7 +212,7 @@ async def add_file(
     raw_content: Optional[bytes] = None,
     extracted_text: Optional[str] = None,
 ) -> str:
-    file_pk = file_id or str(uuid.uuid4())
+    file_pk = file_id or uuid.uuid4().hex
     session.add(
         SessionFile(
             id=file_pk,
@@ -218,7 +260,7 @@ async def upsert_note(
             await session.flush()
             return note_id
 
-    new_id = str(uuid.uuid4())
+    new_id = uuid.uuid4().hex
     session.add(
         Note(
             id=new_id,
@@ -327,8 +369,10 @@ async def delete_file(session: AsyncSession, file_id: str) -> bool:
 
 
 async def get_file(session: AsyncSession, file_id: str) -> Optional[dict]:
-    """Get a single file by ID."""
-    file = await session.get(SessionFile, file_id)
+    """Get a single file by ID (the only reader that loads the raw bytes)."""
+    file = await session.get(
+        SessionFile, file_id, options=(undefer(SessionFile.raw_content),)
+    )
     if not file:
         return None
     
@@ -22,6 +22,7 @@ os.environ["LANGCHAIN_PROJECT"] = os.getenv("LANGCHAIN_PROJECT", "lawsphere")
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_client import make_asgi_app
 import structlog
 
@@ -30,9 +31,12 @@ from app.api import chat, files, search, health
 from app.api import trust_chat, sessions
 from app.api import knowledge_graph
 from app.api import similarity
+from app.integrations.indian_kanoon import close_indian_kanoon_client
+from app.models.groq_client import close_groq_client
+from app.models.ollama_client import init_ollama_client, close_ollama_client
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
-from app.db import init_db
+from app.db import init_db, close_db
 
 # Configure structured logging
 structlog.configure(
@@ -61,11 +65,22 @@ async def lifespan(app: FastAPI):
     await init_db()
     # await init_redis()
     # await init_embeddings()
-    
+
+    # Start the batched audit-log writer (drains queued entries off the hot path)
+    trust_chat.audit_logger.start_background_writer()
+
+    # Warm the Ollama pool so the first routed request skips connection setup
+    await init_ollama_client()
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down Lawsphere AI Service")
+    await trust_chat.audit_logger.stop_background_writer()
+    await close_indian_kanoon_client()
+    await close_groq_client()
+    await close_ollama_client()
+    await close_db()
     # await close_connections()
 
 
@@ -75,6 +90,9 @@ app = FastAPI(
     description="AI orchestration service for legal-tech platform",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson serializes every dict-returning endpoint 3-10x faster than
+    # stdlib json, which matters for the large document payloads
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
 )
@@ -83,6 +101,7 @@ app = FastAPI(
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.ALLOWED_ORIGINS,
+    allow_origin_regex=settings.ALLOWED_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],